@@ -0,0 +1,22 @@
+from collections import Counter
+
+ENABLED = False
+counts: Counter[str] = Counter()
+
+
+def increment(name: str, amount: int = 1):
+    counts[name] += amount
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    counts.clear()
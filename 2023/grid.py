@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import mmap
+from typing import Iterator
+
+Buffer = bytes | mmap.mmap
+
+
+class Grid:
+    buffer: Buffer
+    width: int
+    stride: int
+    height: int
+
+    def __init__(self, buffer: Buffer):
+        self.width = buffer.find(b"\n")
+        if self.width > 0 and buffer[self.width - 1] == ord("\r"):
+            # CRLF input: every index below assumes a one-byte line ending, so give up the mmap for a normalised copy.
+            buffer = bytes(buffer).replace(b"\r\n", b"\n")
+            self.width -= 1
+        self.buffer = buffer
+        if self.width == -1:
+            self.width = len(buffer)
+        self.stride = self.width + 1
+        self.height = (len(buffer) + 1) // self.stride
+
+    @classmethod
+    def from_file(cls, filename: str) -> Grid:
+        with open(filename, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __reduce__(self):
+        return self.__class__, (bytes(self.buffer),)
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.stride + col
+
+    def row_col(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.stride)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def cell(self, index: int) -> int:
+        return self.buffer[index]
+
+    def row(self, row: int) -> bytes:
+        start = row * self.stride
+        end = start + self.width
+        return self.buffer[start:end]
+
+    def row_start(self, row: int) -> int:
+        return row * self.stride
+
+    def cells(self) -> Iterator[int]:
+        for row in range(self.height):
+            yield from range(row * self.stride, row * self.stride + self.width)
+
+    def find_all(self, value: bytes) -> Iterator[int]:
+        index = self.buffer.find(value)
+        while index != -1:
+            yield index
+            index = self.buffer.find(value, index + 1)
+
+    def neighbours(self, index: int) -> Iterator[int]:
+        row, col = self.row_col(index)
+        if col > 0:
+            yield index - 1
+        if col < self.width - 1:
+            yield index + 1
+        if row > 0:
+            yield index - self.stride
+        if row < self.height - 1:
+            yield index + self.stride
+
+    def surrounding(self, index: int) -> Iterator[int]:
+        row, col = self.row_col(index)
+        for row_offset in (-1, 0, 1):
+            for col_offset in (-1, 0, 1):
+                if (row_offset or col_offset) and self.in_bounds(row + row_offset, col + col_offset):
+                    yield index + row_offset * self.stride + col_offset
@@ -0,0 +1,38 @@
+from array import array
+from typing import Iterator
+
+CHUNK_SIZE = 1 << 24
+
+
+def read_lines(filename: str) -> Iterator[str]:
+    with open(filename, "r") as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+def read_byte_lines(filename: str) -> Iterator[bytes]:
+    with open(filename, "rb") as file:
+        for line in file:
+            yield line.rstrip(b"\r\n")
+
+
+def read_line_chunks(filename: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    with open(filename, "rb") as file:
+        remainder = b""
+        while chunk := file.read(chunk_size):
+            end = chunk.rfind(b"\n") + 1
+            if end == 0:
+                remainder += chunk
+                continue
+            yield remainder + chunk[:end]
+            remainder = chunk[end:]
+        if remainder:
+            yield remainder
+
+
+def split_integers(data: str | bytes) -> array:
+    # Whitespace-separated integers after an optional "label:" prefix. str.split and int() beat a regex scan about
+    # twofold, so only the label is cut off rather than searching for the numbers.
+    if isinstance(data, str):
+        return array("q", map(int, data.rpartition(":")[2].split()))
+    return array("q", map(int, data.rpartition(b":")[2].split()))
@@ -0,0 +1,11 @@
+import re
+from array import array
+
+INTEGER_PATTERN = re.compile(r"-?\d+")
+INTEGER_PATTERN_BYTES = re.compile(rb"-?\d+")
+
+
+def extract_integers(data: str | bytes | memoryview) -> array:
+    if isinstance(data, str):
+        return array("q", map(int, INTEGER_PATTERN.findall(data)))
+    return array("q", map(int, INTEGER_PATTERN_BYTES.findall(data)))
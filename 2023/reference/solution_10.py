@@ -0,0 +1,248 @@
+import math
+from enum import Enum
+
+from reference.grid import Grid
+
+
+class Direction(Enum):
+    UP = "up"
+    DOWN = "down"
+    LEFT = "left"
+    RIGHT = "right"
+
+
+class Orientation(Enum):
+    CLOCKWISE = "clockwise"
+    COUNTERCLOCKWISE = "counterclockwise"
+
+
+class PipeMap:
+    grid: Grid
+    start_position: int
+    empty_spaces: set[int]
+    loop: tuple[int, ...]
+    loop_positions: dict[int, int]
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.start_position = grid.buffer.find(b"S")
+        self.empty_spaces = set(grid.find_all(b"."))
+
+    @property
+    def loop_length(self) -> int:
+        return len(self.loop)
+
+    def follow_loop(self):
+        this_position = self.start_position
+        direction = self._determine_initial_direction(this_position)
+        loop_points = []
+        while True:
+            assert direction is not None
+            loop_points.append(this_position)
+            this_position = determine_next_position(this_position, direction, self.grid.stride)
+            direction = self._determine_new_direction(this_position, direction)
+            if direction is None:
+                self.loop = tuple(loop_points)
+                self.loop_positions = {position: idx for idx, position in enumerate(loop_points)}
+                return
+
+    def simplify(self):
+        self.empty_spaces.update(position for position in self.grid.cells() if position not in self.loop_positions)
+
+    def size_of_contained_area(self) -> int:
+        orientation = self._get_orientation_of_loop()
+        inside_spaces = set()
+        outside_spaces = set()
+        for empty_space in self.empty_spaces:
+            is_on_inside_of_loop = self._is_on_inside_of_loop(empty_space, orientation)
+            if is_on_inside_of_loop is True:
+                inside_spaces.add(empty_space)
+            elif is_on_inside_of_loop is False:
+                outside_spaces.add(empty_space)
+            else:
+                assert is_on_inside_of_loop is None
+
+        while uncategorised_spaces := (self.empty_spaces - inside_spaces - outside_spaces):
+            for empty_space in uncategorised_spaces:
+                if touches(empty_space, inside_spaces, self.grid.stride):
+                    inside_spaces.add(empty_space)
+                elif touches(empty_space, outside_spaces, self.grid.stride):
+                    outside_spaces.add(empty_space)
+
+        return len(inside_spaces)
+
+    def _get_next_in_loop(self, position: int) -> int:
+        return self.loop[(self.loop_positions[position] + 1) % len(self.loop)]
+
+    def _get_previous_in_loop(self, position: int) -> int:
+        return self.loop[self.loop_positions[position] - 1]
+
+    def _is_on_inside_of_loop(self, space: int, orientation: Orientation) -> bool | None:
+        if (position_to_the_right := space + 1) in self.loop_positions:
+            previous_in_loop = self._get_previous_in_loop(position_to_the_right)
+            next_in_loop = self._get_next_in_loop(position_to_the_right)
+            previous_direction = get_direction(previous_in_loop, position_to_the_right, self.grid.stride)
+            next_direction = get_direction(position_to_the_right, next_in_loop, self.grid.stride)
+            if Direction.DOWN in (previous_direction, next_direction):
+                return orientation is Orientation.CLOCKWISE
+            elif Direction.UP in (previous_direction, next_direction):
+                return orientation is Orientation.COUNTERCLOCKWISE
+
+        if (position_below := space + self.grid.stride) in self.loop_positions:
+            previous_in_loop = self._get_previous_in_loop(position_below)
+            next_in_loop = self._get_next_in_loop(position_below)
+            previous_direction = get_direction(previous_in_loop, position_below, self.grid.stride)
+            next_direction = get_direction(position_below, next_in_loop, self.grid.stride)
+            if Direction.LEFT in (previous_direction, next_direction):
+                return orientation is Orientation.CLOCKWISE
+            elif Direction.RIGHT in (previous_direction, next_direction):
+                return orientation is Orientation.COUNTERCLOCKWISE
+
+        if (position_to_the_left := space - 1) in self.loop_positions:
+            previous_in_loop = self._get_previous_in_loop(position_to_the_left)
+            next_in_loop = self._get_next_in_loop(position_to_the_left)
+            previous_direction = get_direction(previous_in_loop, position_to_the_left, self.grid.stride)
+            next_direction = get_direction(position_to_the_left, next_in_loop, self.grid.stride)
+            if Direction.UP in (previous_direction, next_direction):
+                return orientation is Orientation.CLOCKWISE
+            elif Direction.DOWN in (previous_direction, next_direction):
+                return orientation is Orientation.COUNTERCLOCKWISE
+
+        if (position_above := space - self.grid.stride) in self.loop_positions:
+            previous_in_loop = self._get_previous_in_loop(position_above)
+            next_in_loop = self._get_next_in_loop(position_above)
+            previous_direction = get_direction(previous_in_loop, position_above, self.grid.stride)
+            next_direction = get_direction(position_above, next_in_loop, self.grid.stride)
+            if Direction.RIGHT in (previous_direction, next_direction):
+                return orientation is Orientation.CLOCKWISE
+            elif Direction.LEFT in (previous_direction, next_direction):
+                return orientation is Orientation.COUNTERCLOCKWISE
+
+        return None
+
+    def _get_orientation_of_loop(self) -> Orientation:
+        top_left_point_on_loop = min(self.loop)
+        next_point_in_loop = self._get_next_in_loop(top_left_point_on_loop)
+        if next_point_in_loop == top_left_point_on_loop + 1:
+            return Orientation.CLOCKWISE
+        elif next_point_in_loop == top_left_point_on_loop + self.grid.stride:
+            return Orientation.COUNTERCLOCKWISE
+        raise ValueError("Cannot determine orientation")
+
+    def _determine_initial_direction(self, position: int) -> Direction:
+        row, col = self.grid.row_col(position)
+        if col != self.grid.width - 1:
+            to_the_right = self._get_pipe_configuration(position + 1)
+            if to_the_right in ("J", "7", "-"):
+                return Direction.RIGHT
+        if col != 0:
+            to_the_left = self._get_pipe_configuration(position - 1)
+            if to_the_left in ("F", "L", "-"):
+                return Direction.LEFT
+        if row != self.grid.height - 1:
+            downwards = self._get_pipe_configuration(position + self.grid.stride)
+            if downwards in ("L", "J", "|"):
+                return Direction.DOWN
+        if row != 0:
+            upwards = self._get_pipe_configuration(position - self.grid.stride)
+            if upwards in ("7", "F", "|"):
+                return Direction.UP
+        raise ValueError(f"I'm stuck at {self.grid.row_col(position)}!")
+
+    def _determine_new_direction(self, position: int, previous_direction: Direction) -> Direction | None:
+        pipe_configuration = self._get_pipe_configuration(position)
+        if pipe_configuration in ("-", "|"):
+            return previous_direction
+        elif pipe_configuration == "J":
+            if previous_direction is Direction.RIGHT:
+                return Direction.UP
+            elif previous_direction is Direction.DOWN:
+                return Direction.LEFT
+            raise ValueError(f"Entered a `J` from the {previous_direction}")
+        elif pipe_configuration == "F":
+            if previous_direction is Direction.LEFT:
+                return Direction.DOWN
+            elif previous_direction is Direction.UP:
+                return Direction.RIGHT
+            raise ValueError(f"Entered a `F` from the {previous_direction}")
+        elif pipe_configuration == "7":
+            if previous_direction is Direction.RIGHT:
+                return Direction.DOWN
+            elif previous_direction is Direction.UP:
+                return Direction.LEFT
+            raise ValueError(f"Entered a `7` from the {previous_direction}")
+        elif pipe_configuration == "L":
+            if previous_direction is Direction.LEFT:
+                return Direction.UP
+            elif previous_direction is Direction.DOWN:
+                return Direction.RIGHT
+            raise ValueError(f"Entered a `L` from the {previous_direction}")
+        elif pipe_configuration == "S":
+            return None
+        raise ValueError(f"Unexpected pipe: {pipe_configuration} at {position} with direction {previous_direction}")
+
+    def _get_pipe_configuration(self, position: int) -> str:
+        return chr(self.grid.cell(position))
+
+
+def get_direction(first_position: int, second_position: int, stride: int) -> Direction:
+    match second_position - first_position:
+        case -1:
+            return Direction.LEFT
+        case 1:
+            return Direction.RIGHT
+        case offset if offset == -stride:
+            return Direction.UP
+        case offset if offset == stride:
+            return Direction.DOWN
+    raise ValueError(f"{first_position} and {second_position} are not adjacent")
+
+
+def determine_next_position(position: int, direction: Direction, stride: int) -> int:
+    match direction:
+        case Direction.UP:
+            return position - stride
+        case Direction.DOWN:
+            return position + stride
+        case Direction.RIGHT:
+            return position + 1
+        case Direction.LEFT:
+            return position - 1
+    raise ValueError(f"Expected a valid direction, got {direction}")
+
+
+def touches(this_position: int, positions: set[int], stride: int) -> bool:
+    return (
+        this_position - 1 in positions
+        or this_position + 1 in positions
+        or this_position - stride in positions
+        or this_position + stride in positions
+    )
+
+
+def parse(filename: str) -> PipeMap:
+    pipe_map = PipeMap(Grid.from_file(filename))
+    pipe_map.follow_loop()
+    return pipe_map
+
+
+def solve_part_one(pipe_map: PipeMap) -> int:
+    return math.floor(pipe_map.loop_length / 2)
+
+
+def solve_part_two(pipe_map: PipeMap) -> int:
+    pipe_map.simplify()
+    return pipe_map.size_of_contained_area()
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    pipe_map = parse(filename)
+    return solve_part_one(pipe_map), solve_part_two(pipe_map)
+
+
+def do_part_one(filename: str) -> int:
+    return solve_part_one(parse(filename))
+
+
+def do_part_two(filename: str) -> int:
+    return solve_part_two(parse(filename))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from reference.grid import Grid
+
+
+@dataclass(slots=True, frozen=True)
+class Universe:
+    rows: array
+    cols: array
+    dimensions: tuple[int, int]
+
+    @classmethod
+    def from_grid(cls, grid: Grid):
+        rows, cols = array("q"), array("q")
+        for position in grid.find_all(b"#"):
+            row, col = grid.row_col(position)
+            rows.append(row)
+            cols.append(col)
+        return cls(rows, cols, (grid.height, grid.width))
+
+    def expand(self, factor: int) -> Universe:
+        n_rows, n_cols = self.dimensions
+        empty_rows = sorted(set(range(n_rows)).difference(self.rows))
+        empty_cols = sorted(set(range(n_cols)).difference(self.cols))
+        expanded_rows = array("q", (row + bisect_left(empty_rows, row) * factor for row in self.rows))
+        expanded_cols = array("q", (col + bisect_left(empty_cols, col) * factor for col in self.cols))
+        return Universe(
+            expanded_rows, expanded_cols, (n_rows + len(empty_rows) * factor, n_cols + len(empty_cols) * factor)
+        )
+
+    def shortest_path_between_galaxies(self):
+        sum_of_shortest_paths = 0
+        rows, cols = self.rows, self.cols
+        for idx in range(len(rows)):
+            row, col = rows[idx], cols[idx]
+            for j in range(idx + 1, len(rows)):
+                sum_of_shortest_paths += abs(row - rows[j]) + abs(col - cols[j])
+        return sum_of_shortest_paths
+
+
+def parse(filename: str) -> Universe:
+    return Universe.from_grid(Grid.from_file(filename))
+
+
+def solve_part_one(universe_map: Universe) -> int:
+    return universe_map.expand(factor=1).shortest_path_between_galaxies()
+
+
+def solve_part_two(universe_map: Universe, factor: int = 999999) -> int:
+    return universe_map.expand(factor).shortest_path_between_galaxies()
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    universe_map = parse(filename)
+    return solve_part_one(universe_map), solve_part_two(universe_map)
+
+
+def do_part_one(filename: str) -> int:
+    return solve_part_one(parse(filename))
+
+
+def do_part_two(filename: str, factor: int = 999999) -> int:
+    return solve_part_two(parse(filename), factor)
@@ -1,39 +1,139 @@
 import re
+from collections import deque
+from typing import Iterable
+
+from parsing import read_line_chunks
 
 PATTERN_NUMERALS = re.compile(r"[1-9]")
-PATTERN_ALPHANUMERIC = re.compile(r"(?=([1-9]|one|two|three|four|five|six|seven|eight|nine))")
 STRING_TO_INT = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9}
-
-
-def convert_digit(match: str) -> int:
-    if len(match) == 1:
-        return int(match)
-    return STRING_TO_INT[match]
+DIGITS = STRING_TO_INT | {str(value): value for value in STRING_TO_INT.values()}
+NOT_A_DIGIT_OR_NEWLINE = bytes(sorted(set(range(256)) - set(b"123456789\n")))
+# Translation table marking every byte but a line ending as b"x", so that b"\nx" counts the non-empty lines.
+LINE_MARKS = bytes(byte if byte in b"\r\n" else ord("x") for byte in range(256)).replace(b"\r", b"\n")
+# Keeping the first and last letter of every word lets overlapping words such as "eightwo" survive the replacement.
+DIGIT_WORD_REPLACEMENTS = tuple(
+    (word.encode(), f"{word[0]}{value}{word[-1]}".encode()) for word, value in STRING_TO_INT.items()
+)
+
+
+class DigitScanner:
+    # An Aho-Corasick automaton with the failure links folded into the transitions, so every character is a single
+    # dict lookup. Missing transitions lead back to the root (state 0).
+    transitions: list[dict[str, int]]
+    outputs: list[int]
+
+    def __init__(self, words: dict[str, int]):
+        self.transitions = [{}]
+        self.outputs = [0]
+        for word, value in words.items():
+            state = 0
+            for char in word:
+                if char not in self.transitions[state]:
+                    self.transitions.append({})
+                    self.outputs.append(0)
+                    self.transitions[state][char] = len(self.transitions) - 1
+                state = self.transitions[state][char]
+            self.outputs[state] = value
+
+        alphabet = set("".join(words))
+        failures = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            self.outputs[state] = self.outputs[state] or self.outputs[failure]
+            for char in alphabet:
+                if (child := self.transitions[state].get(char)) is not None:
+                    failures[child] = self.transitions[failure].get(char, 0)
+                    queue.append(child)
+                elif (next_state := self.transitions[failure].get(char, 0)) != 0:
+                    self.transitions[state][char] = next_state
+
+    def find_first(self, chars: Iterable[str]) -> int:
+        transitions, outputs = self.transitions, self.outputs
+        state = 0
+        for char in chars:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                return outputs[state]
+        raise ValueError("No digit found")
+
+
+# No digit word contains another one, so the match that ends first also starts first. Scanning the reversed line
+# for the reversed words therefore finds the last digit.
+FORWARD_SCANNER = DigitScanner(DIGITS)
+BACKWARD_SCANNER = DigitScanner({word[::-1]: value for word, value in DIGITS.items()})
 
 
 def find_first_and_last_digit(line: str) -> tuple[int, int]:
-    digits = [convert_digit(match.group(1)) for match in PATTERN_ALPHANUMERIC.finditer(line)]
-    return digits[0], digits[-1]
+    return FORWARD_SCANNER.find_first(line), BACKWARD_SCANNER.find_first(reversed(line))
 
 
+# Both the per-line scorers and the whole-buffer path let blank lines score 0 and reject any other line without a
+# digit with ValueError("No digit found").
 def parse_line(line: str) -> int:
-    digits = [int(match) for match in PATTERN_NUMERALS.findall(line)]
-    return 10 * digits[0] + digits[-1]
+    if not line:
+        return 0
+    if not (digits := PATTERN_NUMERALS.findall(line)):
+        raise ValueError("No digit found")
+    return 10 * int(digits[0]) + int(digits[-1])
 
 
 def parse_line_part_two(line: str) -> int:
+    if not line:
+        return 0
     first, last = find_first_and_last_digit(line)
     return first * 10 + last
 
 
+def replace_digit_words(buffer: bytes) -> bytes:
+    for word, replacement in DIGIT_WORD_REPLACEMENTS:
+        buffer = buffer.replace(word, replacement)
+    return buffer
+
+
+def sum_calibration_values(buffer: bytes) -> int:
+    # With everything but digits and newlines removed, a line's first digit follows a newline and its last digit
+    # precedes one, so counting those pairs for every digit sums the whole buffer without looking at single lines.
+    digits = b"\n" + buffer.translate(None, NOT_A_DIGIT_OR_NEWLINE) + b"\n"
+    total = lines_with_digits = 0
+    for value in range(1, 10):
+        digit = str(value).encode()
+        firsts = digits.count(b"\n" + digit)
+        lines_with_digits += firsts
+        total += value * (10 * firsts + digits.count(digit + b"\n"))
+    if lines_with_digits != (b"\n" + buffer.translate(LINE_MARKS)).count(b"\nx"):
+        raise ValueError("No digit found")
+    return total
+
+
+LINE_SCORERS = {1: parse_line, 2: parse_line_part_two}
+
+
+def parse(filename: str) -> bytes:
+    with open(filename, "rb") as file:
+        return file.read()
+
+
+def solve_part_one(buffer: bytes) -> int:
+    return sum_calibration_values(buffer)
+
+
+def solve_part_two(buffer: bytes) -> int:
+    return sum_calibration_values(replace_digit_words(buffer))
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    buffer = parse(filename)
+    return solve_part_one(buffer), solve_part_two(buffer)
+
+
 def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        return sum(parse_line(line) for line in file.read().splitlines())
+    return sum(solve_part_one(chunk) for chunk in read_line_chunks(filename))
 
 
 def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        return sum(parse_line_part_two(line) for line in file.read().splitlines())
+    return sum(solve_part_two(chunk) for chunk in read_line_chunks(filename))
 
 
 def main():
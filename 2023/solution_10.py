@@ -1,7 +1,9 @@
 import math
-from dataclasses import dataclass
 from enum import Enum
 
+import counters
+from grid import Grid
+
 
 class Direction(Enum):
     UP = "up"
@@ -15,32 +17,17 @@ class Orientation(Enum):
     COUNTERCLOCKWISE = "counterclockwise"
 
 
-@dataclass(slots=True, frozen=True)
-class Position:
-    x: int
-    y: int
-
-
 class PipeMap:
-    full_map: list[str]
-    start_position: Position
-    empty_spaces: set[Position]
-    max_x: int
-    max_y: int
-    loop: tuple[Position, ...]
-    loop_positions: set[Position]
-
-    def __init__(self, lines: list[str]):
-        self.full_map = lines
-        self.max_x = len(lines[0]) - 1
-        self.max_y = len(lines) - 1
-        self.empty_spaces = set()
-        for idx, line in enumerate(lines):
-            for jdx, char in enumerate(line):
-                if char == "S":
-                    self.start_position = Position(jdx, idx)
-                elif char == ".":
-                    self.empty_spaces.add(Position(jdx, idx))
+    grid: Grid
+    start_position: int
+    empty_spaces: set[int]
+    loop: tuple[int, ...]
+    loop_positions: dict[int, int]
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.start_position = grid.buffer.find(b"S")
+        self.empty_spaces = set(grid.find_all(b"."))
 
     @property
     def loop_length(self) -> int:
@@ -53,26 +40,15 @@ class PipeMap:
         while True:
             assert direction is not None
             loop_points.append(this_position)
-            this_position = determine_next_position(this_position, direction)
+            this_position = determine_next_position(this_position, direction, self.grid.stride)
             direction = self._determine_new_direction(this_position, direction)
             if direction is None:
                 self.loop = tuple(loop_points)
-                self.loop_positions = set(loop_points)
+                self.loop_positions = {position: idx for idx, position in enumerate(loop_points)}
                 return
 
     def simplify(self):
-        simplified_map = []
-        for idx, row in enumerate(self.full_map):
-            simplified_row = []
-            for jdx, char in enumerate(row):
-                if (this_position := Position(jdx, idx)) in self.loop_positions:
-                    simplified_row.append(char)
-                else:
-                    self.empty_spaces.add(this_position)
-                    simplified_row.append(".")
-            simplified_map.append("".join(simplified_row))
-
-        self.full_map = simplified_map
+        self.empty_spaces.update(position for position in self.grid.cells() if position not in self.loop_positions)
 
     def size_of_contained_area(self) -> int:
         orientation = self._get_orientation_of_loop()
@@ -89,59 +65,55 @@ class PipeMap:
 
         while uncategorised_spaces := (self.empty_spaces - inside_spaces - outside_spaces):
             for empty_space in uncategorised_spaces:
-                if touches(empty_space, inside_spaces):
+                if touches(empty_space, inside_spaces, self.grid.stride):
                     inside_spaces.add(empty_space)
-                elif touches(empty_space, outside_spaces):
+                elif touches(empty_space, outside_spaces, self.grid.stride):
                     outside_spaces.add(empty_space)
 
         return len(inside_spaces)
 
-    def _get_next_in_loop(self, position: Position):
-        try:
-            return self.loop[self.loop.index(position) + 1]
-        except IndexError:
-            assert self.loop.index(position) == len(self.loop) - 1
-            return self.loop[0]
+    def _get_next_in_loop(self, position: int) -> int:
+        return self.loop[(self.loop_positions[position] + 1) % len(self.loop)]
 
-    def _get_previous_in_loop(self, position: Position):
-        return self.loop[self.loop.index(position) - 1]
+    def _get_previous_in_loop(self, position: int) -> int:
+        return self.loop[self.loop_positions[position] - 1]
 
-    def _is_on_inside_of_loop(self, space: Position, orientation: Orientation) -> bool | None:
-        if (position_to_the_right := Position(space.x + 1, space.y)) in self.loop_positions:
+    def _is_on_inside_of_loop(self, space: int, orientation: Orientation) -> bool | None:
+        if (position_to_the_right := space + 1) in self.loop_positions:
             previous_in_loop = self._get_previous_in_loop(position_to_the_right)
             next_in_loop = self._get_next_in_loop(position_to_the_right)
-            previous_direction = get_direction(previous_in_loop, position_to_the_right)
-            next_direction = get_direction(position_to_the_right, next_in_loop)
+            previous_direction = get_direction(previous_in_loop, position_to_the_right, self.grid.stride)
+            next_direction = get_direction(position_to_the_right, next_in_loop, self.grid.stride)
             if Direction.DOWN in (previous_direction, next_direction):
                 return orientation is Orientation.CLOCKWISE
             elif Direction.UP in (previous_direction, next_direction):
                 return orientation is Orientation.COUNTERCLOCKWISE
 
-        if (position_below := Position(space.x, space.y + 1)) in self.loop_positions:
+        if (position_below := space + self.grid.stride) in self.loop_positions:
             previous_in_loop = self._get_previous_in_loop(position_below)
             next_in_loop = self._get_next_in_loop(position_below)
-            previous_direction = get_direction(previous_in_loop, position_below)
-            next_direction = get_direction(position_below, next_in_loop)
+            previous_direction = get_direction(previous_in_loop, position_below, self.grid.stride)
+            next_direction = get_direction(position_below, next_in_loop, self.grid.stride)
             if Direction.LEFT in (previous_direction, next_direction):
                 return orientation is Orientation.CLOCKWISE
             elif Direction.RIGHT in (previous_direction, next_direction):
                 return orientation is Orientation.COUNTERCLOCKWISE
 
-        if (position_to_the_left := Position(space.x - 1, space.y)) in self.loop_positions:
+        if (position_to_the_left := space - 1) in self.loop_positions:
             previous_in_loop = self._get_previous_in_loop(position_to_the_left)
             next_in_loop = self._get_next_in_loop(position_to_the_left)
-            previous_direction = get_direction(previous_in_loop, position_to_the_left)
-            next_direction = get_direction(position_to_the_left, next_in_loop)
+            previous_direction = get_direction(previous_in_loop, position_to_the_left, self.grid.stride)
+            next_direction = get_direction(position_to_the_left, next_in_loop, self.grid.stride)
             if Direction.UP in (previous_direction, next_direction):
                 return orientation is Orientation.CLOCKWISE
             elif Direction.DOWN in (previous_direction, next_direction):
                 return orientation is Orientation.COUNTERCLOCKWISE
 
-        if (position_above := Position(space.x, space.y - 1)) in self.loop_positions:
+        if (position_above := space - self.grid.stride) in self.loop_positions:
             previous_in_loop = self._get_previous_in_loop(position_above)
             next_in_loop = self._get_next_in_loop(position_above)
-            previous_direction = get_direction(previous_in_loop, position_above)
-            next_direction = get_direction(position_above, next_in_loop)
+            previous_direction = get_direction(previous_in_loop, position_above, self.grid.stride)
+            next_direction = get_direction(position_above, next_in_loop, self.grid.stride)
             if Direction.RIGHT in (previous_direction, next_direction):
                 return orientation is Orientation.CLOCKWISE
             elif Direction.LEFT in (previous_direction, next_direction):
@@ -150,43 +122,35 @@ class PipeMap:
         return None
 
     def _get_orientation_of_loop(self) -> Orientation:
-        top_left_point_on_loop = self._find_top_left_point_on_loop()
-        next_point_in_loop = self.loop[self.loop.index(top_left_point_on_loop) + 1]
-        if top_left_point_on_loop.y == next_point_in_loop.y and top_left_point_on_loop.x == next_point_in_loop.x - 1:
+        top_left_point_on_loop = min(self.loop)
+        next_point_in_loop = self._get_next_in_loop(top_left_point_on_loop)
+        if next_point_in_loop == top_left_point_on_loop + 1:
             return Orientation.CLOCKWISE
-        elif top_left_point_on_loop.x == next_point_in_loop.x and top_left_point_on_loop.y == next_point_in_loop.y - 1:
+        elif next_point_in_loop == top_left_point_on_loop + self.grid.stride:
             return Orientation.COUNTERCLOCKWISE
         raise ValueError("Cannot determine orientation")
 
-    def _find_top_left_point_on_loop(self) -> Position:
-        min_y_of_loop = min(point.y for point in self.loop)
-        top_most_points = [point for point in self.loop if point.y == min_y_of_loop]
-        min_x_of_top_most_points = min(point.x for point in top_most_points)
-        for point in top_most_points:
-            if point.x == min_x_of_top_most_points:
-                return point
-        raise ValueError("No top-left point")
-
-    def _determine_initial_direction(self, position: Position) -> Direction:
-        if position.x != self.max_x:
-            to_the_right = self._get_pipe_configuration(Position(position.x + 1, position.y))
+    def _determine_initial_direction(self, position: int) -> Direction:
+        row, col = self.grid.row_col(position)
+        if col != self.grid.width - 1:
+            to_the_right = self._get_pipe_configuration(position + 1)
             if to_the_right in ("J", "7", "-"):
                 return Direction.RIGHT
-        if position.x != 0:
-            to_the_left = self._get_pipe_configuration(Position(position.x - 1, position.y))
+        if col != 0:
+            to_the_left = self._get_pipe_configuration(position - 1)
             if to_the_left in ("F", "L", "-"):
                 return Direction.LEFT
-        if position.y != self.max_y:
-            downwards = self._get_pipe_configuration(Position(position.x, position.y + 1))
+        if row != self.grid.height - 1:
+            downwards = self._get_pipe_configuration(position + self.grid.stride)
             if downwards in ("L", "J", "|"):
                 return Direction.DOWN
-        if position.y != 0:
-            upwards = self._get_pipe_configuration(Position(position.x, position.y - 1))
+        if row != 0:
+            upwards = self._get_pipe_configuration(position - self.grid.stride)
             if upwards in ("7", "F", "|"):
                 return Direction.UP
-        raise ValueError(f"I'm stuck at {position}!")
+        raise ValueError(f"I'm stuck at {self.grid.row_col(position)}!")
 
-    def _determine_new_direction(self, position: Position, previous_direction: Direction) -> Direction | None:
+    def _determine_new_direction(self, position: int, previous_direction: Direction) -> Direction | None:
         pipe_configuration = self._get_pipe_configuration(position)
         if pipe_configuration in ("-", "|"):
             return previous_direction
@@ -218,58 +182,75 @@ class PipeMap:
             return None
         raise ValueError(f"Unexpected pipe: {pipe_configuration} at {position} with direction {previous_direction}")
 
-    def _get_pipe_configuration(self, position: Position) -> str:
-        return self.full_map[position.y][position.x]
+    def _get_pipe_configuration(self, position: int) -> str:
+        return chr(self.grid.cell(position))
 
 
-def get_direction(first_position: Position, second_position: Position):
-    if first_position.x == second_position.x:
-        assert first_position.y != second_position.y
-        return Direction.UP if first_position.y > second_position.y else Direction.DOWN
-    assert first_position.y == second_position.y
-    return Direction.LEFT if first_position.x > second_position.x else Direction.RIGHT
+def get_direction(first_position: int, second_position: int, stride: int) -> Direction:
+    match second_position - first_position:
+        case -1:
+            return Direction.LEFT
+        case 1:
+            return Direction.RIGHT
+        case offset if offset == -stride:
+            return Direction.UP
+        case offset if offset == stride:
+            return Direction.DOWN
+    raise ValueError(f"{first_position} and {second_position} are not adjacent")
 
 
-def determine_next_position(position: Position, direction: Direction) -> Position:
+def determine_next_position(position: int, direction: Direction, stride: int) -> int:
     match direction:
         case Direction.UP:
-            return Position(position.x, position.y - 1)
+            return position - stride
         case Direction.DOWN:
-            return Position(position.x, position.y + 1)
+            return position + stride
         case Direction.RIGHT:
-            return Position(position.x + 1, position.y)
+            return position + 1
         case Direction.LEFT:
-            return Position(position.x - 1, position.y)
+            return position - 1
     raise ValueError(f"Expected a valid direction, got {direction}")
 
 
-def touches(this_position: Position, positions: set[Position]) -> bool:
-    for position in positions:
-        if (
-            this_position.x == position.x
-            and abs(this_position.y - position.y) == 1
-            or this_position.y == position.y
-            and abs(this_position.x - position.x) == 1
-        ):
-            return True
-    return False
+def touches(this_position: int, positions: set[int], stride: int) -> bool:
+    if counters.ENABLED:
+        counters.increment("touches")
+    return (
+        this_position - 1 in positions
+        or this_position + 1 in positions
+        or this_position - stride in positions
+        or this_position + stride in positions
+    )
 
 
-def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        pipe_map = PipeMap(file.read().splitlines())
+def parse(filename: str) -> PipeMap:
+    pipe_map = PipeMap(Grid.from_file(filename))
     pipe_map.follow_loop()
+    return pipe_map
+
+
+def solve_part_one(pipe_map: PipeMap) -> int:
     return math.floor(pipe_map.loop_length / 2)
 
 
-def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        pipe_map = PipeMap(file.read().splitlines())
-    pipe_map.follow_loop()
+def solve_part_two(pipe_map: PipeMap) -> int:
     pipe_map.simplify()
     return pipe_map.size_of_contained_area()
 
 
+def solve_both(filename: str) -> tuple[int, int]:
+    pipe_map = parse(filename)
+    return solve_part_one(pipe_map), solve_part_two(pipe_map)
+
+
+def do_part_one(filename: str) -> int:
+    return solve_part_one(parse(filename))
+
+
+def do_part_two(filename: str) -> int:
+    return solve_part_two(parse(filename))
+
+
 def main():
     assert do_part_one("input_10_test") == 4
     assert do_part_one("input_10_test_2") == 8
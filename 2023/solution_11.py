@@ -1,60 +1,70 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
 
-
-@dataclass(slots=True)
-class Galaxy:
-    row: int
-    col: int
-
-    def manhattan_distance(self, other: Galaxy) -> int:
-        return abs(self.row - other.row) + (abs(self.col - other.col))
+from grid import Grid
 
 
 @dataclass(slots=True, frozen=True)
 class Universe:
-    galaxies: list[Galaxy]
+    rows: array
+    cols: array
     dimensions: tuple[int, int]
 
     @classmethod
-    def from_file(cls, lines: list[str]):
-        galaxies = [Galaxy(row, col) for row, line in enumerate(lines) for col, char in enumerate(line) if char == "#"]
-        dimensions = len(lines), len(lines[0])
-        return cls(galaxies, dimensions)
-
-    def expand(self, factor: int):
-        used_rows = {galaxy.row for galaxy in self.galaxies}
-        used_cols = {galaxy.col for galaxy in self.galaxies}
+    def from_grid(cls, grid: Grid):
+        rows, cols = array("q"), array("q")
+        for position in grid.find_all(b"#"):
+            row, col = grid.row_col(position)
+            rows.append(row)
+            cols.append(col)
+        return cls(rows, cols, (grid.height, grid.width))
+
+    def expand(self, factor: int) -> Universe:
         n_rows, n_cols = self.dimensions
-        empty_rows = set(range(n_rows)) - used_rows
-        empty_cols = set(range(n_cols)) - used_cols
-        for galaxy in self.galaxies:
-            empty_rows_above = len([row for row in empty_rows if row < galaxy.row])
-            empty_cols_to_the_left = len([col for col in empty_cols if col < galaxy.col])
-            galaxy.row += empty_rows_above * factor
-            galaxy.col += empty_cols_to_the_left * factor
+        empty_rows = sorted(set(range(n_rows)).difference(self.rows))
+        empty_cols = sorted(set(range(n_cols)).difference(self.cols))
+        expanded_rows = array("q", (row + bisect_left(empty_rows, row) * factor for row in self.rows))
+        expanded_cols = array("q", (col + bisect_left(empty_cols, col) * factor for col in self.cols))
+        return Universe(
+            expanded_rows, expanded_cols, (n_rows + len(empty_rows) * factor, n_cols + len(empty_cols) * factor)
+        )
 
     def shortest_path_between_galaxies(self):
         sum_of_shortest_paths = 0
-        for idx, galaxy in enumerate(self.galaxies):
-            for j in range(idx + 1, len(self.galaxies)):
-                sum_of_shortest_paths += galaxy.manhattan_distance(self.galaxies[j])
+        rows, cols = self.rows, self.cols
+        for idx in range(len(rows)):
+            row, col = rows[idx], cols[idx]
+            for j in range(idx + 1, len(rows)):
+                sum_of_shortest_paths += abs(row - rows[j]) + abs(col - cols[j])
         return sum_of_shortest_paths
 
 
+def parse(filename: str) -> Universe:
+    return Universe.from_grid(Grid.from_file(filename))
+
+
+def solve_part_one(universe_map: Universe) -> int:
+    return universe_map.expand(factor=1).shortest_path_between_galaxies()
+
+
+def solve_part_two(universe_map: Universe, factor: int = 999999) -> int:
+    return universe_map.expand(factor).shortest_path_between_galaxies()
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    universe_map = parse(filename)
+    return solve_part_one(universe_map), solve_part_two(universe_map)
+
+
 def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        universe_map = Universe.from_file(file.read().splitlines())
-    universe_map.expand(factor=1)
-    return universe_map.shortest_path_between_galaxies()
+    return solve_part_one(parse(filename))
 
 
-def do_part_two(filename: str, factor: int) -> int:
-    with open(filename, "r") as file:
-        universe_map = Universe.from_file(file.read().splitlines())
-    universe_map.expand(factor)
-    return universe_map.shortest_path_between_galaxies()
+def do_part_two(filename: str, factor: int = 999999) -> int:
+    return solve_part_two(parse(filename), factor)
 
 
 def main():
@@ -1,78 +1,166 @@
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable
+
+from parsing import read_lines
+
+Cubes = tuple[int, int, int]
+LIMITS: Cubes = (12, 13, 14)
+MAX_INDEX_CELLS = 1 << 24
 
 
 @dataclass(slots=True, frozen=True)
-class GameInfo:
-    red: int
-    green: int
-    blue: int
+class GameIndex:
+    # Sums of game IDs over the compressed (red, green, blue) maxima, accumulated along all three axes, so that the
+    # entry for a bag holds the sum of IDs of every game whose maxima all fit in it. The table is dense, one 8-byte
+    # cell per combination of distinct maxima, so it is capped at MAX_INDEX_CELLS (128 MiB); larger logs fall back to
+    # SortedGames.
+    reds: list[int]
+    greens: list[int]
+    blues: list[int]
+    prefix_sums: array
 
     @classmethod
-    def from_attempt(cls, attempt: str):
-        red = green = blue = 0
-        for cube in attempt.split(", "):
-            count, color = cube.split(" ")
-            match color:
-                case "red":
-                    red = int(count)
-                case "green":
-                    green = int(count)
-                case "blue":
-                    blue = int(count)
-        return cls(red, green, blue)
-
-    def is_valid(self) -> bool:
-        if self.red > 12:
-            return False
-        if self.green > 13:
-            return False
-        if self.blue > 14:
-            return False
-        return True
-
-
-def determine_power(game_infos: list[GameInfo]) -> int:
-    max_red = max(game_info.red for game_info in game_infos if game_info.red != 0)
-    max_green = max(game_info.green for game_info in game_infos if game_info.green != 0)
-    max_blue = max(game_info.blue for game_info in game_infos if game_info.blue != 0)
-    return max_red * max_green * max_blue
+    def from_maxima(cls, games: Iterable[tuple[int, Cubes]]):
+        games = list(games)
+        reds, greens, blues = (sorted({maxima[colour] for _, maxima in games}) for colour in range(3))
+        n_reds, n_greens, n_blues = len(reds) + 1, len(greens) + 1, len(blues) + 1
+        if (cells := n_reds * n_greens * n_blues) > MAX_INDEX_CELLS:
+            raise ValueError(f"A bag limit index over {cells} cells exceeds the {MAX_INDEX_CELLS} cell cap")
+        prefix_sums = array("q", bytes(8 * cells))
+        for game_id, (red, green, blue) in games:
+            red_idx, green_idx, blue_idx = bisect_left(reds, red), bisect_left(greens, green), bisect_left(blues, blue)
+            prefix_sums[((red_idx + 1) * n_greens + green_idx + 1) * n_blues + blue_idx + 1] += game_id
+
+        for stride, length in ((n_greens * n_blues, n_reds), (n_blues, n_greens), (1, n_blues)):
+            for idx in range(len(prefix_sums)):
+                if (idx // stride) % length != 0:
+                    prefix_sums[idx] += prefix_sums[idx - stride]
+        return cls(reds, greens, blues, prefix_sums)
+
+    def sum_of_possible_ids(self, limits: Cubes = LIMITS) -> int:
+        max_red, max_green, max_blue = limits
+        red_idx = bisect_right(self.reds, max_red)
+        green_idx = bisect_right(self.greens, max_green)
+        blue_idx = bisect_right(self.blues, max_blue)
+        return self.prefix_sums[(red_idx * (len(self.greens) + 1) + green_idx) * (len(self.blues) + 1) + blue_idx]
 
 
-def parse_game_info(raw: str) -> list[GameInfo]:
-    return [GameInfo.from_attempt(attempt) for attempt in raw.split("; ")]
-
+@dataclass(slots=True, frozen=True)
+class SortedGames:
+    # Games sorted by their red maximum: a query bisects to the games whose reds fit and checks only those. Slower per
+    # query than GameIndex, but its size is linear in the number of games.
+    reds: list[int]
+    games: list[tuple[int, Cubes]]
 
-def parse_game_input(line: str) -> tuple[int, list[GameInfo]]:
-    game_id_raw, game_info_raw = line.split(": ")
-    game_id = int(game_id_raw.split(" ")[-1])
-    game_infos = parse_game_info(game_info_raw)
-    return game_id, game_infos
+    @classmethod
+    def from_maxima(cls, games: Iterable[tuple[int, Cubes]]):
+        games = sorted(games, key=lambda game: game[1][0])
+        return cls([maxima[0] for _, maxima in games], games)
+
+    def sum_of_possible_ids(self, limits: Cubes = LIMITS) -> int:
+        fitting_reds = islice(self.games, bisect_right(self.reds, limits[0]))
+        return sum(game_id for game_id, maxima in fitting_reds if is_possible(maxima, limits))
+
+
+def build_limit_index(games: Iterable[tuple[int, Cubes]]) -> GameIndex | SortedGames:
+    games = list(games)
+    try:
+        return GameIndex.from_maxima(games)
+    except ValueError:
+        return SortedGames.from_maxima(games)
+
+
+def parse_game_input(line: str) -> tuple[int, Cubes]:
+    # Walk the line in place: each draw is "<count> <colour>[,;] ", the count is accumulated digit by digit and the
+    # colour is told apart by its first character, so no per-draw strings or lists are created.
+    colon = line.find(":", 5)
+    game_id = int(line[5:colon])
+    max_red = max_green = max_blue = 0
+    pos = colon + 2
+    while pos:
+        space = line.find(" ", pos)
+        count = ord(line[pos]) - 48
+        while (pos := pos + 1) < space:
+            count = count * 10 + ord(line[pos]) - 48
+        match line[space + 1]:
+            case "r":
+                if count > max_red:
+                    max_red = count
+            case "g":
+                if count > max_green:
+                    max_green = count
+            case "b":
+                if count > max_blue:
+                    max_blue = count
+        pos = line.find(" ", space + 1) + 1
+    return game_id, (max_red, max_green, max_blue)
+
+
+def is_possible(maxima: Cubes, limits: Cubes = LIMITS) -> bool:
+    max_red, max_green, max_blue = maxima
+    limit_red, limit_green, limit_blue = limits
+    return max_red <= limit_red and max_green <= limit_green and max_blue <= limit_blue
+
+
+def determine_power(maxima: Cubes) -> int:
+    max_red, max_green, max_blue = maxima
+    return max_red * max_green * max_blue
 
 
-def parse_line(line: str) -> int:
-    game_id, game_infos = parse_game_input(line)
-    if all(game_info.is_valid() for game_info in game_infos):
+def get_id_if_valid(game_id: int, maxima: Cubes, limits: Cubes = LIMITS) -> int:
+    if is_possible(maxima, limits):
         return game_id
     return 0
 
 
+def parse_line(line: str) -> int:
+    return get_id_if_valid(*parse_game_input(line))
+
+
 def parse_line_part_two(line: str) -> int:
-    _, game_infos = parse_game_input(line)
-    return determine_power(game_infos)
+    _, maxima = parse_game_input(line)
+    return determine_power(maxima)
+
+
+LINE_SCORERS = {1: parse_line, 2: parse_line_part_two}
+
+
+def parse(filename: str) -> list[tuple[int, Cubes]]:
+    return [parse_game_input(line) for line in read_lines(filename)]
+
+
+def solve_part_one(games: Iterable[tuple[int, Cubes]]) -> int:
+    return sum(get_id_if_valid(game_id, maxima) for game_id, maxima in games)
+
+
+def solve_part_two(games: Iterable[tuple[int, Cubes]]) -> int:
+    return sum(determine_power(maxima) for _, maxima in games)
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    games = parse(filename)
+    return solve_part_one(games), solve_part_two(games)
 
 
 def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        return sum(parse_line(line) for line in file.read().splitlines())
+    return solve_part_one(map(parse_game_input, read_lines(filename)))
 
 
 def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        return sum(parse_line_part_two(line) for line in file.read().splitlines())
+    return solve_part_two(map(parse_game_input, read_lines(filename)))
+
+
+def do_limit_queries(filename: str, queries: Iterable[Cubes]) -> list[int]:
+    index = build_limit_index(parse(filename))
+    return [index.sum_of_possible_ids(limits) for limits in queries]
 
 
 def main():
     assert do_part_one("input_2_test") == 8
+    assert do_limit_queries("input_2_test", [LIMITS]) == [8]
     print(do_part_one("input_2_full"))
     assert do_part_two("input_2_test") == 2286
     print(do_part_two("input_2_full"))
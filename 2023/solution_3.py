@@ -1,84 +1,220 @@
+from array import array
+from dataclasses import dataclass
 from math import prod
 from re import Match, compile
-
-NUMBER_PATTERN = compile(r"\d+")
-GEAR_PATTERN = compile(r"\*")
-
-
-def is_valid_part_number(match: Match, row_number: int, all_data: list[str]) -> bool:
-    start_pos = match.start()
-    end_pos = match.end()
+from types import ModuleType
+from typing import Iterable, Iterator, TypeVar
+
+from grid import Grid
+from parsing import read_byte_lines
+
+NUMBER_PATTERN = compile(rb"\d+")
+GEAR_PATTERN = compile(rb"\*")
+EMPTY = ord(".")
+ZERO, NINE = ord("0"), ord("9")
+# NumPy is optional and only pays off on large schematics; below this size the regex path is faster.
+VECTORISED_MIN_BYTES = 1 << 16
+# Longer numbers do not fit in int64, so schematics holding one are left to the regex path.
+MAX_VECTORISED_DIGITS = 18
+
+T = TypeVar("T")
+NumberSpan = tuple[int, int, int]
+Row = tuple[bytes, list[NumberSpan]]
+EMPTY_ROW: Row = (b"", [])
+
+
+@dataclass(slots=True, frozen=True)
+class NumberIndex:
+    # labels holds, for every byte of the grid, 0 or the 1-based ID of the number covering it; values maps IDs back
+    # to the numbers, so any cell's neighbourhood can be resolved to distinct numbers without rescanning rows. Labels
+    # are 4-byte ints, which keeps the index at four times the grid's size.
+    labels: array
+    values: list[int]
+
+    @classmethod
+    def from_grid(cls, grid: Grid):
+        labels = array("i", bytes(4 * len(grid.buffer)))
+        values: list[int] = []
+        for match in NUMBER_PATTERN.finditer(grid.buffer):
+            start, end = match.span()
+            values.append(int(match.group()))
+            labels[start:end] = array("i", (len(values),)) * (end - start)
+        return cls(labels, values)
+
+    def surrounding_numbers(self, grid: Grid, index: int) -> list[int]:
+        labels = {self.labels[neighbour] for neighbour in grid.surrounding(index)}
+        labels.discard(0)
+        return [self.values[label - 1] for label in labels]
+
+
+def is_empty(grid: Grid, start: int, end: int) -> bool:
+    return grid.buffer[start:end].count(b".") == end - start
+
+
+def is_valid_part_number(match: Match, grid: Grid) -> bool:
+    row_number, start_pos = grid.row_col(match.start())
+    end_pos = start_pos + len(match.group())
     first_match_pos = max(start_pos - 1, 0)
-    last_match_pos = min(end_pos, len(all_data[row_number]) - 1)
-    if start_pos != 0 and all_data[row_number][first_match_pos] != ".":
+    last_match_pos = min(end_pos, grid.width - 1)
+    if start_pos != 0 and grid.cell(match.start() - 1) != EMPTY:
         return True
-    if end_pos != len(all_data[row_number]) and all_data[row_number][last_match_pos] != ".":
+    if end_pos != grid.width and grid.cell(match.end()) != EMPTY:
         return True
-    if row_number != 0 and not all(
-        all_data[row_number - 1][idx] == "." for idx in range(first_match_pos, last_match_pos + 1)
+    if row_number != 0 and not is_empty(
+        grid, grid.index(row_number - 1, first_match_pos), grid.index(row_number - 1, last_match_pos) + 1
     ):
         return True
-    if row_number != len(all_data) - 1 and not all(
-        all_data[row_number + 1][idx] == "." for idx in range(first_match_pos, last_match_pos + 1)
+    if row_number != grid.height - 1 and not is_empty(
+        grid, grid.index(row_number + 1, first_match_pos), grid.index(row_number + 1, last_match_pos) + 1
     ):
         return True
     return False
 
 
-def get_part_number_if_valid(match: Match, row_number: int, all_data: list[str]) -> int:
-    if is_valid_part_number(match, row_number, all_data):
+def get_part_number_if_valid(match: Match, grid: Grid) -> int:
+    if is_valid_part_number(match, grid):
         return int(match.group())
     return 0
 
 
-def get_gear_ratio_if_valid(match: Match, row_number: int, all_data: list[str]) -> int:
-    if len(surrounding_numbers := get_surrounding_numbers(match, row_number, all_data)) == 2:
+def get_gear_ratio_if_valid(match: Match, grid: Grid, number_index: NumberIndex) -> int:
+    if len(surrounding_numbers := number_index.surrounding_numbers(grid, match.start())) == 2:
         return prod(surrounding_numbers)
     return 0
 
 
-def get_surrounding_numbers(match: Match, row_number: int, all_data: list[str]) -> tuple[int, ...]:
-    start_pos = match.start()
-    end_pos = match.end()
-    surrounding_numbers = []
-    if row_number != 0:
-        numbers_in_row_above = NUMBER_PATTERN.finditer(all_data[row_number - 1])
-        for match_ in numbers_in_row_above:
-            if set(range(match_.start(), match_.end() + 1)).intersection(range(start_pos, end_pos + 1)) != set():
-                surrounding_numbers.append(int(match_.group()))
+def load_numpy() -> ModuleType | None:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def solve_part_1_vectorised(grid: Grid, np: ModuleType) -> int | None:
+    height, width = grid.height, grid.width
+    cells = np.frombuffer(grid.buffer, dtype=np.uint8)
+    if len(cells) < height * grid.stride:
+        cells = np.append(cells, np.uint8(ord("\n")))
+    cells = cells.reshape(height, grid.stride)[:, :width]
+    padded = np.pad(cells, 1, constant_values=EMPTY)
+    digits = (padded >= ZERO) & (padded <= NINE)
+    symbols = (padded != EMPTY) & ~digits
+
+    # A number counts when a symbol is in its 3x3 neighbourhood, or, as in is_valid_part_number, when any digit sits
+    # in the row directly above or below it.
+    touched = np.zeros(cells.shape, dtype=bool)
+    for mask, row_offsets in ((symbols, (-1, 0, 1)), (digits, (-1, 1))):
+        for row_offset in row_offsets:
+            rows = slice(1 + row_offset, 1 + row_offset + height)
+            for col_offset in (-1, 0, 1):
+                touched |= mask[rows, slice(1 + col_offset, 1 + col_offset + width)]
+
+    # Keep one padding column on each side so that digit runs never continue onto the next row once flattened.
+    flat_digits = digits[1:-1].ravel()
+    flat_touched = np.pad(touched, ((0, 0), (1, 1))).ravel()
+    flat_values = padded[1:-1].ravel().astype(np.int64) - ZERO
+    run_starts = flat_digits & ~np.concatenate(([False], flat_digits[:-1]))
+    labels = np.cumsum(run_starts) * flat_digits
+
+    digit_positions = np.flatnonzero(flat_digits)
+    digit_labels = labels[digit_positions] - 1
+    run_lengths = np.bincount(digit_labels)
+    if len(run_lengths) and run_lengths.max() > MAX_VECTORISED_DIGITS:
+        return None
+    run_ends = np.flatnonzero(run_starts) + run_lengths - 1
+    powers = np.power(np.int64(10), run_ends[digit_labels] - digit_positions)
+    numbers = np.zeros(len(run_ends), dtype=np.int64)
+    np.add.at(numbers, digit_labels, flat_values[digit_positions] * powers)
+    part_labels = np.unique(labels[flat_digits & flat_touched]) - 1
+    return sum(numbers[part_labels].tolist())
+
+
+def sliding_windows(items: Iterable[T], empty: T) -> Iterator[tuple[T, T, T]]:
+    above, row = empty, None
+    for below in items:
+        if row is not None:
+            yield above, row, below
+            above = row
+        row = below
+    if row is not None:
+        yield above, row, empty
+
+
+def read_rows(filename: str) -> Iterator[Row]:
+    for line in read_byte_lines(filename):
+        yield line, [(*match.span(), int(match.group())) for match in NUMBER_PATTERN.finditer(line)]
+
+
+def has_symbol(line: bytes, start: int, end: int) -> bool:
+    segment = line[start:end]
+    return segment.count(b".") != len(segment)
+
+
+def part_numbers_in_window(above: Row, row: Row, below: Row) -> Iterator[int]:
+    line, numbers = row
+    width = len(line)
+    for start, end, number in numbers:
+        first, last = max(start - 1, 0), min(end + 1, width)
+        if (
+            start != 0
+            and line[start - 1] != EMPTY
+            or end != width
+            and line[end] != EMPTY
+            or has_symbol(above[0], first, last)
+            or has_symbol(below[0], first, last)
+        ):
+            yield number
+
+
+def gear_ratios_in_window(above: Row, row: Row, below: Row) -> Iterator[int]:
+    line, numbers = row
+    for match in GEAR_PATTERN.finditer(line):
+        col = match.start()
+        surrounding_numbers = [number for start, end, number in numbers if end == col or start == col + 1]
+        for _, adjacent_numbers in (above, below):
+            surrounding_numbers.extend(
+                number for start, end, number in adjacent_numbers if start <= col + 1 and col <= end
+            )
+        if len(surrounding_numbers) == 2:
+            yield prod(surrounding_numbers)
+
+
+def stream_part_1(filename: str) -> int:
+    return sum(sum(part_numbers_in_window(*window)) for window in sliding_windows(read_rows(filename), EMPTY_ROW))
+
+
+def stream_part_2(filename: str) -> int:
+    return sum(sum(gear_ratios_in_window(*window)) for window in sliding_windows(read_rows(filename), EMPTY_ROW))
+
+
+def parse(filename: str) -> Grid:
+    return Grid.from_file(filename)
+
+
+def solve_part_1(grid: Grid) -> int:
+    if len(grid.buffer) >= VECTORISED_MIN_BYTES and (np := load_numpy()) is not None:
+        if (answer := solve_part_1_vectorised(grid, np)) is not None:
+            return answer
+    return sum(get_part_number_if_valid(match, grid) for match in NUMBER_PATTERN.finditer(grid.buffer))
+
 
-    numbers_in_same_row = NUMBER_PATTERN.finditer(all_data[row_number])
-    for match_ in numbers_in_same_row:
-        if match_.start() == end_pos or match_.end() == start_pos:
-            surrounding_numbers.append(int(match_.group()))
+def solve_part_2(grid: Grid) -> int:
+    number_index = NumberIndex.from_grid(grid)
+    return sum(get_gear_ratio_if_valid(match, grid, number_index) for match in GEAR_PATTERN.finditer(grid.buffer))
 
-    if row_number != len(all_data) - 1:
-        numbers_in_row_below = NUMBER_PATTERN.finditer(all_data[row_number + 1])
-        for match_ in numbers_in_row_below:
-            if set(range(match_.start(), match_.end() + 1)).intersection(range(start_pos, end_pos + 1)) != set():
-                surrounding_numbers.append(int(match_.group()))
 
-    return tuple(surrounding_numbers)
+def solve_both(filename: str) -> tuple[int, int]:
+    grid = parse(filename)
+    return solve_part_1(grid), solve_part_2(grid)
 
 
 def do_part_1(filename: str) -> int:
-    with open(filename, "r") as file:
-        all_data = file.read().splitlines()
-    return sum(
-        get_part_number_if_valid(match, idx, all_data)
-        for idx, line in enumerate(all_data)
-        for match in NUMBER_PATTERN.finditer(line)
-    )
+    return stream_part_1(filename)
 
 
 def do_part_2(filename: str) -> int:
-    with open(filename, "r") as file:
-        all_data = file.read().splitlines()
-    return sum(
-        get_gear_ratio_if_valid(match, idx, all_data)
-        for idx, line in enumerate(all_data)
-        for match in GEAR_PATTERN.finditer(line)
-    )
+    return stream_part_2(filename)
 
 
 def main():
@@ -1,7 +1,7 @@
-import re
 from collections import defaultdict
+from typing import Iterable
 
-PATTERN = re.compile(r"\d+")
+from parsing import read_lines
 
 
 def get_game_data_from_line(line: str) -> str:
@@ -9,7 +9,7 @@ def get_game_data_from_line(line: str) -> str:
 
 
 def parse_raw_numbers(raw_input: str) -> set[int]:
-    return {int(match) for match in PATTERN.findall(raw_input)}
+    return {int(number) for number in raw_input.split()}
 
 
 def parse_game_data(game_data: str) -> tuple[set[int], set[int]]:
@@ -23,25 +23,47 @@ def determine_number_of_matches(line: str) -> int:
     return len(winning_numbers.intersection(my_numbers))
 
 
-def get_value_of_scorecard(line: str) -> int:
-    number_of_matches = determine_number_of_matches(line)
+def get_value_of_number_of_matches(number_of_matches: int) -> int:
     return 2 ** (number_of_matches - 1) if number_of_matches > 0 else 0
 
 
-def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        return sum(get_value_of_scorecard(line) for line in file.read().splitlines())
+def get_value_of_scorecard(line: str) -> int:
+    return get_value_of_number_of_matches(determine_number_of_matches(line))
 
 
-def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        numbers_of_matches = [determine_number_of_matches(line) for line in file.read().splitlines()]
-    card_counts: dict[int, int] = defaultdict(lambda: 1)
+LINE_SCORERS = {1: get_value_of_scorecard}
+
+
+def parse(filename: str) -> list[int]:
+    return [determine_number_of_matches(line) for line in read_lines(filename)]
+
+
+def solve_part_one(numbers_of_matches: Iterable[int]) -> int:
+    return sum(get_value_of_number_of_matches(number_of_matches) for number_of_matches in numbers_of_matches)
+
+
+def solve_part_two(numbers_of_matches: Iterable[int]) -> int:
+    extra_copies: dict[int, int] = defaultdict(int)
+    number_of_cards = 0
     for game_id, number_of_matches in enumerate(numbers_of_matches, start=1):
-        _ = card_counts[game_id]
+        card_count = 1 + extra_copies.pop(game_id, 0)
+        number_of_cards += card_count
         for i in range(1, number_of_matches + 1):
-            card_counts[game_id + i] += card_counts[game_id]
-    return sum(value for key, value in card_counts.items() if key <= len(numbers_of_matches))
+            extra_copies[game_id + i] += card_count
+    return number_of_cards
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    numbers_of_matches = parse(filename)
+    return solve_part_one(numbers_of_matches), solve_part_two(numbers_of_matches)
+
+
+def do_part_one(filename: str) -> int:
+    return solve_part_one(map(determine_number_of_matches, read_lines(filename)))
+
+
+def do_part_two(filename: str) -> int:
+    return solve_part_two(map(determine_number_of_matches, read_lines(filename)))
 
 
 def main():
@@ -1,9 +1,16 @@
 import itertools
+import re
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
-from typing import Generic, Iterator, TypeVar
+from typing import Generic, Sequence, TypeVar
+
+import counters
+from parsing import split_integers
 
 T = TypeVar("T")
+NUMBER_OF_ITEM_TYPE_MAPPERS = 7
+BLOCK_SEPARATOR = re.compile(rb"\r?\n\r?\n")
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,15 +33,9 @@ class ItemTypeMapper:
     item_type_map_by_destination_range_start: dict[int, ItemTypeMap] | None = None
 
     @classmethod
-    def from_lines(cls, line_iterator: Iterator[str]):
-        item_type_maps = []
-        try:
-            while (line := next(line_iterator)) != "":
-                destination_range_start, source_range_start, range_length = [int(entry) for entry in line.split(" ")]
-                item_type_maps.append(ItemTypeMap(destination_range_start, source_range_start, range_length))
-            return cls(item_type_maps)
-        except StopIteration:
-            return cls(item_type_maps)
+    def from_numbers(cls, numbers: Sequence[int]):
+        entries = iter(numbers)
+        return cls(list(map(ItemTypeMap, entries, entries, entries)))
 
     @property
     def source_range_starts(self) -> list[int]:
@@ -55,11 +56,15 @@ class ItemTypeMapper:
         return self.item_type_map_by_destination_range_start[destination_range_start]
 
     def map(self, value: int) -> int:
+        if counters.ENABLED:
+            counters.increment("ItemTypeMapper.map")
         if self.should_be_mapped(value):
             return self.mapped_value(value)
         return value
 
     def map_and_get_range(self, value: int, current_range: int | None) -> tuple[int, int]:
+        if counters.ENABLED:
+            counters.increment("ItemTypeMapper.map_and_get_range")
         mapped_value = self.map(value)
         source_range_start = find_closest_number_smaller_or_equals(value, self.source_range_starts)
         if source_range_start is None:
@@ -93,6 +98,18 @@ class ItemTypeMapper:
         return item_type_map.destination_range_start + (value - item_type_map.source_range_start)
 
 
+@dataclass(frozen=True, slots=True)
+class Almanac:
+    seed_numbers: array
+    item_type_mappers: tuple[ItemTypeMapper, ...]
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        seeds_block, *blocks = BLOCK_SEPARATOR.split(data, NUMBER_OF_ITEM_TYPE_MAPPERS)
+        item_type_mappers = tuple(ItemTypeMapper.from_numbers(split_integers(block)) for block in blocks)
+        return cls(split_integers(seeds_block), item_type_mappers)
+
+
 class AlmanacDataABC(ABC, Generic[T]):
     seeds: list[T]
     seed_to_soil: ItemTypeMapper
@@ -103,33 +120,28 @@ class AlmanacDataABC(ABC, Generic[T]):
     temperature_to_humidity: ItemTypeMapper
     humidity_to_location: ItemTypeMapper
 
-    def __init__(self, lines: list[str]):
-        line_iterator = iter(lines)
-        self.seeds = self.parse_seeds(next(line_iterator))
-        next(line_iterator)
-        self.seed_to_soil = self.parse_block(line_iterator)
-        self.soil_to_fertilizer = self.parse_block(line_iterator)
-        self.fertilizer_to_water = self.parse_block(line_iterator)
-        self.water_to_light = self.parse_block(line_iterator)
-        self.light_to_temperature = self.parse_block(line_iterator)
-        self.temperature_to_humidity = self.parse_block(line_iterator)
-        self.humidity_to_location = self.parse_block(line_iterator)
+    def __init__(self, almanac: Almanac):
+        self.seeds = self.parse_seeds(almanac.seed_numbers)
+        (
+            self.seed_to_soil,
+            self.soil_to_fertilizer,
+            self.fertilizer_to_water,
+            self.water_to_light,
+            self.light_to_temperature,
+            self.temperature_to_humidity,
+            self.humidity_to_location,
+        ) = almanac.item_type_mappers
 
     @staticmethod
     @abstractmethod
-    def parse_seeds(line: str) -> list[T]:
+    def parse_seeds(numbers: Sequence[int]) -> list[T]:
         pass
 
-    @staticmethod
-    def parse_block(line_iterator: Iterator[str]) -> ItemTypeMapper:
-        next(line_iterator)
-        return ItemTypeMapper.from_lines(line_iterator)
-
 
 class AlmanacDataPartOne(AlmanacDataABC[int]):
     @staticmethod
-    def parse_seeds(line: str) -> list[int]:
-        return [int(number) for number in line.split(":")[-1].strip().split(" ")]
+    def parse_seeds(numbers: Sequence[int]) -> list[int]:
+        return list(numbers)
 
     def get_lowest_location_number_for_seeds(self) -> int:
         return min(self.get_location_for_seed(seed) for seed in self.seeds)
@@ -160,8 +172,7 @@ class AlmanacDataPartTwo(AlmanacDataABC[SeedRange]):
     seed_range_by_seed_range_start: dict[int, SeedRange] | None = None
 
     @staticmethod
-    def parse_seeds(line: str) -> list[SeedRange]:
-        numbers = [int(number) for number in line.split(":")[-1].strip().split(" ")]
+    def parse_seeds(numbers: Sequence[int]) -> list[SeedRange]:
         return [SeedRange(start=start, length=length) for start, length in itertools.batched(numbers, 2)]
 
     @property
@@ -265,16 +276,30 @@ def safe_min(a: int | None, b: int | None) -> int:
     return min(a, b)
 
 
+def parse(filename: str) -> Almanac:
+    with open(filename, "rb") as file:
+        return Almanac.from_bytes(file.read())
+
+
+def solve_part_one(almanac: Almanac) -> int:
+    return AlmanacDataPartOne(almanac).get_lowest_location_number_for_seeds()
+
+
+def solve_part_two(almanac: Almanac) -> int:
+    return AlmanacDataPartTwo(almanac).get_lowest_location_number_for_seeds()
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    almanac = parse(filename)
+    return solve_part_one(almanac), solve_part_two(almanac)
+
+
 def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        data = AlmanacDataPartOne(file.read().splitlines())
-    return data.get_lowest_location_number_for_seeds()
+    return solve_part_one(parse(filename))
 
 
 def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        data = AlmanacDataPartTwo(file.read().splitlines())
-    return data.get_lowest_location_number_for_seeds()
+    return solve_part_two(parse(filename))
 
 
 def main():
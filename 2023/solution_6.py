@@ -1,6 +1,9 @@
 import math
+from array import array
 from dataclasses import dataclass
 
+from parsing import split_integers
+
 
 @dataclass(frozen=True, slots=True)
 class Race:
@@ -8,16 +11,26 @@ class Race:
     distance: int
 
 
-def parse_file_part_one(lines: list[str]) -> list[Race]:
-    times = lines[0].split(":")[-1].strip().split()
-    distances = lines[1].split(":")[-1].strip().split()
-    return [Race(time=int(time), distance=int(distance)) for time, distance in zip(times, distances)]
+@dataclass(frozen=True, slots=True)
+class RaceSheet:
+    times: array
+    distances: array
+
+
+def parse_file(lines: list[bytes]) -> RaceSheet:
+    return RaceSheet(split_integers(lines[0]), split_integers(lines[1]))
+
+
+def parse_file_part_one(race_sheet: RaceSheet) -> list[Race]:
+    return [Race(time=time, distance=distance) for time, distance in zip(race_sheet.times, race_sheet.distances)]
+
+
+def parse_file_part_two(race_sheet: RaceSheet) -> Race:
+    return Race(time=concatenate(race_sheet.times), distance=concatenate(race_sheet.distances))
 
 
-def parse_file_part_two(lines: list[str]) -> Race:
-    times = lines[0].split(":")[-1].strip().split()
-    distances = lines[1].split(":")[-1].strip().split()
-    return Race(time=int("".join(times)), distance=int("".join(distances)))
+def concatenate(numbers: array) -> int:
+    return int("".join(map(str, numbers)))
 
 
 def number_of_ways_to_win(race: Race) -> int:
@@ -37,16 +50,30 @@ def solve_quadratic(a: int, b: int, c: int) -> tuple[float, float]:
     return (-b + math.sqrt(discriminant)) / (2 * a), (-b - math.sqrt(discriminant)) / (2 * a)
 
 
+def parse(filename: str) -> RaceSheet:
+    with open(filename, "rb") as file:
+        return parse_file(file.read().splitlines())
+
+
+def solve_part_one(race_sheet: RaceSheet) -> int:
+    return math.prod(number_of_ways_to_win(race) for race in parse_file_part_one(race_sheet))
+
+
+def solve_part_two(race_sheet: RaceSheet) -> int:
+    return number_of_ways_to_win(parse_file_part_two(race_sheet))
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    race_sheet = parse(filename)
+    return solve_part_one(race_sheet), solve_part_two(race_sheet)
+
+
 def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        races = parse_file_part_one(file.read().splitlines())
-    return math.prod(number_of_ways_to_win(race) for race in races)
+    return solve_part_one(parse(filename))
 
 
 def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        race = parse_file_part_two(file.read().splitlines())
-    return number_of_ways_to_win(race)
+    return solve_part_two(parse(filename))
 
 
 def main():
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Self, Tuple
 
+import counters
+
 
 class HandType(Enum):
     FIVE_OF_A_KIND = "Five of a kind"
@@ -38,17 +40,14 @@ class HandABC(ABC):
     bid: int
     type: HandType | None = None
 
-    @classmethod
-    def from_line(cls, line: str):
-        cards, bid = line.split()
-        return cls(cards=tuple(cards), bid=int(bid))
-
     def __post_init__(self):
         assert len(self.cards) == 5, "Expected hand of length 5"
         self.type = self.determine_hand_type(self.cards)
         assert self.type is not None
 
     def __lt__(self, other: Self) -> bool:
+        if counters.ENABLED:
+            counters.increment("HandABC.__lt__")
         assert self.type is not None
         assert other.type is not None
         if self.type is other.type:
@@ -147,18 +146,40 @@ def get_hand_type_from_cards(cards: Cards) -> HandType:
     return HandType.HIGH_CARD
 
 
-def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        hands = [HandPartOne.from_line(line) for line in file.read().splitlines()]
+def parse_line(line: str) -> tuple[Cards, int]:
+    cards, bid = line.split()
+    return tuple(cards), int(bid)
+
+
+def get_total_winnings(hands: list[HandABC]) -> int:
     sorted_hands = sorted(hands)
     return sum(rank * hand.bid for rank, hand in enumerate(sorted_hands, start=1))
 
 
-def do_part_two(filename: str) -> int:
+def parse(filename: str) -> list[tuple[Cards, int]]:
     with open(filename, "r") as file:
-        hands = [HandPartTwo.from_line(line) for line in file.read().splitlines()]
-    sorted_hands = sorted(hands)
-    return sum(rank * hand.bid for rank, hand in enumerate(sorted_hands, start=1))
+        return [parse_line(line) for line in file.read().splitlines()]
+
+
+def solve_part_one(cards_and_bids: list[tuple[Cards, int]]) -> int:
+    return get_total_winnings([HandPartOne(cards=cards, bid=bid) for cards, bid in cards_and_bids])
+
+
+def solve_part_two(cards_and_bids: list[tuple[Cards, int]]) -> int:
+    return get_total_winnings([HandPartTwo(cards=cards, bid=bid) for cards, bid in cards_and_bids])
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    cards_and_bids = parse(filename)
+    return solve_part_one(cards_and_bids), solve_part_two(cards_and_bids)
+
+
+def do_part_one(filename: str) -> int:
+    return solve_part_one(parse(filename))
+
+
+def do_part_two(filename: str) -> int:
+    return solve_part_two(parse(filename))
 
 
 def main():
@@ -3,6 +3,8 @@ import re
 from itertools import cycle
 from typing import Final
 
+import counters
+
 PATTERN = re.compile(r"([A-Z]{3}) = \(([A-Z]{3}), ([A-Z]{3})\)")
 START_NODE: Final[str] = "AAA"
 END_NODE: Final[str] = "ZZZ"
@@ -37,6 +39,8 @@ class MapTraverser:
                 raise ValueError(f"Expected direction, got {direction}")
 
             if this_node in end_nodes:
+                if counters.ENABLED:
+                    counters.increment("MapTraverser._do_traverse steps", self.number_of_steps)
                 return
             self.number_of_steps += 1
 
@@ -57,20 +61,34 @@ def parse_line(line: str) -> tuple[str, tuple[str, str]]:
     return matches.group(1), (matches.group(2), matches.group(3))
 
 
-def do_part_one(filename: str) -> int:
+def parse(filename: str) -> MapTraverser:
     with open(filename, "r") as file:
-        map_traverser = MapTraverser(file.read().splitlines())
+        return MapTraverser(file.read().splitlines())
+
+
+def solve_part_one(map_traverser: MapTraverser) -> int:
     map_traverser.traverse()
     return map_traverser.number_of_steps
 
 
-def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        map_traverser = MapTraverser(file.read().splitlines())
+def solve_part_two(map_traverser: MapTraverser) -> int:
     map_traverser.traverse_part_two()
     return map_traverser.number_of_steps
 
 
+def solve_both(filename: str) -> tuple[int, int]:
+    map_traverser = parse(filename)
+    return solve_part_one(map_traverser), solve_part_two(map_traverser)
+
+
+def do_part_one(filename: str) -> int:
+    return solve_part_one(parse(filename))
+
+
+def do_part_two(filename: str) -> int:
+    return solve_part_two(parse(filename))
+
+
 def main():
     assert do_part_one("input_8_test") == 2
     assert do_part_one("input_8_test_2") == 6
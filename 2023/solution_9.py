@@ -1,32 +1,61 @@
 from itertools import pairwise
+from typing import Iterable, Sequence
+
+from parsing import read_lines
 
 
 def line_to_sequence(line: str) -> list[int]:
     return [int(number) for number in line.split()]
 
 
-def get_next_number(sequence: list[int]) -> int:
+def get_next_number(sequence: Sequence[int]) -> int:
     difference_sequence = [b - a for a, b in pairwise(sequence)]
     if set(difference_sequence) == {0}:
         return sequence[-1]
     return sequence[-1] + get_next_number(difference_sequence)
 
 
-def get_previous_number(sequence: list[int]) -> int:
+def get_previous_number(sequence: Sequence[int]) -> int:
     difference_sequence = [b - a for a, b in pairwise(sequence)]
     if set(difference_sequence) == {0}:
         return sequence[0]
     return sequence[0] - get_previous_number(difference_sequence)
 
 
+def get_next_number_of_line(line: str) -> int:
+    return get_next_number(line_to_sequence(line))
+
+
+def get_previous_number_of_line(line: str) -> int:
+    return get_previous_number(line_to_sequence(line))
+
+
+LINE_SCORERS = {1: get_next_number_of_line, 2: get_previous_number_of_line}
+
+
+def parse(filename: str) -> list[list[int]]:
+    return [line_to_sequence(line) for line in read_lines(filename)]
+
+
+def solve_part_one(sequences: Iterable[list[int]]) -> int:
+    return sum(get_next_number(sequence) for sequence in sequences)
+
+
+def solve_part_two(sequences: Iterable[list[int]]) -> int:
+    return sum(get_previous_number(sequence) for sequence in sequences)
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    sequences = parse(filename)
+    return solve_part_one(sequences), solve_part_two(sequences)
+
+
 def do_part_one(filename: str) -> int:
-    with open(filename, "r") as file:
-        return sum(get_next_number(line_to_sequence(line)) for line in file.read().splitlines())
+    return solve_part_one(map(line_to_sequence, read_lines(filename)))
 
 
 def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        return sum(get_previous_number(line_to_sequence(line)) for line in file.read().splitlines())
+    return solve_part_two(map(line_to_sequence, read_lines(filename)))
 
 
 def main():
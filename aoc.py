@@ -0,0 +1,320 @@
+import json
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from batch import find_inputs, run_batch
+from benchmark import (
+    BASELINE_PATH,
+    BENCHMARK_SCALES,
+    benchmark_cases,
+    find_regressions,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+from client import format_response, request
+from daemon import MAX_PARSED_INPUTS, SOCKET_PATH, serve
+from diff_test import (
+    REPORT_PATH,
+    diff_cases,
+    minimise,
+    run_case,
+    save_report,
+    write_reproducer,
+)
+from generators import GENERATORS, generate
+from mapreduce import get_line_scorer, map_reduce
+from memory import measure_part
+from parse_cache import ParseCache
+from profiler import profile_part
+from registry import available_days, load_solution, reference_days
+from result_store import ResultStore
+from runner import Job, resolve_input, run_jobs, run_parts, timed
+from startup import STARTUP_BUDGET_MS, measure_interpreter_start, measure_startup
+
+
+@click.group()
+def main():
+    pass
+
+
+@main.command()
+@click.option("-d", "--day", type=int, required=True)
+@click.option("-p", "--part", "parts", type=click.IntRange(1, 2), multiple=True, default=(1, 2))
+@click.option("-i", "--input", "input_name", default="full", help="Input file, or suffix of 2023/input_<day>_<suffix>")
+@click.option("--cache/--no-cache", "use_cache", default=True, help="Reuse parsed inputs from the on-disk cache")
+@click.option("--memo", is_flag=True, help="Return stored answers for unchanged code and input")
+@click.option("--count", is_flag=True, help="Count hot-loop events and report them next to the timings")
+@click.option("--profile", is_flag=True, help="Profile with cProfile and write .pstats and collapsed stacks")
+@click.option("--memory", is_flag=True, help="Report peak and retained memory of parsing and solving")
+@click.option("--top", type=click.IntRange(min=1), help="Functions or allocation sites to show  [default: 20 or 5]")
+def run(
+    day: int,
+    parts: tuple[int, ...],
+    input_name: str,
+    use_cache: bool,
+    memo: bool,
+    count: bool,
+    profile: bool,
+    memory: bool,
+    top: int | None,
+):
+    if day not in available_days():
+        raise click.BadParameter(f"No solution for day {day}", param_hint="--day")
+    input_path = resolve_input(day, input_name)
+    if not input_path.is_file():
+        raise click.BadParameter(f"{input_path} does not exist", param_hint="--input")
+    if profile:
+        for part in parts:
+            report = profile_part(day, part, input_path)
+            click.echo(f"Day {day} part {part} ({input_path.name}): {report.answer}")
+            click.echo(f"Wrote {report.stats_path} and {report.collapsed_path}")
+            click.echo(report.top_functions(top or 20))
+        return
+    if memory:
+        for part in parts:
+            click.echo(measure_part(day, part, input_path, top or 5))
+        return
+
+    cache = ParseCache() if use_cache else None
+    for result in run_parts(day, parts, input_path, cache, ResultStore() if memo else None, count):
+        click.echo(result)
+
+
+@main.command(name="all")
+@click.option("-p", "--part", "parts", type=click.IntRange(1, 2), multiple=True, default=(1, 2))
+@click.option(
+    "-i", "--input", "input_names", multiple=True, default=("full",), help="Suffix of 2023/input_<day>_<suffix>"
+)
+@click.option("-w", "--workers", type=click.IntRange(min=1), default=os.cpu_count(), show_default=True)
+@click.option("--cache/--no-cache", "use_cache", default=True, help="Reuse parsed inputs from the on-disk cache")
+@click.option("--memo", is_flag=True, help="Return stored answers for unchanged code and input")
+@click.option("--count", is_flag=True, help="Count hot-loop events and report them next to the timings")
+def run_all(
+    parts: tuple[int, ...], input_names: tuple[str, ...], workers: int, use_cache: bool, memo: bool, count: bool
+):
+    cache = ParseCache() if use_cache else None
+    store = ResultStore() if memo else None
+    jobs: list[Job] = []
+    for day in available_days():
+        for input_name in input_names:
+            if not (input_path := resolve_input(day, input_name)).is_file():
+                click.echo(f"Skipping day {day}: {input_path} does not exist", err=True)
+                continue
+            jobs.extend(Job(day, part, input_path, cache, store, count) for part in parts)
+
+    start = time.perf_counter()
+    results = run_jobs(jobs, workers)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for result in results:
+        click.echo(result)
+    # Per-job times are measured inside warm workers, so their sum excludes process start-up and imports and only
+    # estimates what a serial run would cost.
+    summed_ms = sum(result.total.wall_ms for result in results)
+    failures = sum(result.error is not None for result in results)
+    click.echo(
+        f"{len(results)} jobs on {workers} workers: {elapsed_ms:.2f} ms wall, {summed_ms:.2f} ms summed per-job time"
+        f" ({summed_ms / elapsed_ms:.2f}x estimated speedup), {failures} failed"
+    )
+    if failures:
+        raise click.ClickException(f"{failures} jobs failed")
+
+
+@main.command()
+@click.option("-d", "--day", type=int, required=True)
+@click.option("-p", "--part", "parts", type=click.IntRange(1, 2), multiple=True, default=(1, 2))
+@click.option("-w", "--workers", type=click.IntRange(min=1), default=os.cpu_count(), show_default=True)
+@click.argument("inputs", nargs=-1, required=True)
+def batch(day: int, parts: tuple[int, ...], workers: int, inputs: tuple[str, ...]):
+    if day not in available_days():
+        raise click.BadParameter(f"No solution for day {day}", param_hint="--day")
+    if not (input_paths := find_inputs(inputs)):
+        raise click.BadParameter("No input files found", param_hint="INPUTS")
+
+    start = time.perf_counter()
+    failures = 0
+    for result in run_batch(day, parts, input_paths, workers):
+        failures += result.error is not None
+        click.echo(json.dumps(result.to_json()))
+    elapsed_s = time.perf_counter() - start
+    click.echo(
+        f"{len(input_paths)} inputs in {elapsed_s:.2f} s ({len(input_paths) / elapsed_s * 60:.0f} per minute),"
+        f" {failures} failed",
+        err=True,
+    )
+    if failures:
+        raise click.ClickException(f"{failures} inputs failed")
+
+
+@main.command(name="map-reduce")
+@click.option("-d", "--day", type=int, required=True)
+@click.option("-p", "--part", type=click.IntRange(1, 2), required=True)
+@click.option("-i", "--input", "input_name", default="full", help="Input file, or suffix of 2023/input_<day>_<suffix>")
+@click.option("-w", "--workers", type=click.IntRange(min=1), default=os.cpu_count(), show_default=True)
+def run_map_reduce(day: int, part: int, input_name: str, workers: int):
+    if day not in available_days():
+        raise click.BadParameter(f"No solution for day {day}", param_hint="--day")
+    if get_line_scorer(load_solution(day), part) is None:
+        message = f"Day {day} part {part} is not a sum of independent per-line values"
+        raise click.BadParameter(message, param_hint="--part")
+    if not (input_path := resolve_input(day, input_name)).is_file():
+        raise click.BadParameter(f"{input_path} does not exist", param_hint="--input")
+    try:
+        answer, timing = timed(map_reduce, day, part, input_path, workers)
+    except Exception as error:
+        raise click.ClickException(f"{type(error).__name__}: {error}")
+    click.echo(f"Day {day} part {part} ({input_path.name}): {answer}  {timing} on {workers} workers")
+
+
+@main.command(name="generate")
+@click.option("-d", "--day", type=click.Choice([str(day) for day in GENERATORS]), required=True)
+@click.option("-s", "--scale", type=click.IntRange(min=1), required=True, help="Lines, cards, grid side, ... per day")
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("-o", "--output", type=click.Path(dir_okay=False, path_type=Path), default=None)
+def generate_input(day: str, scale: int, seed: int, output: Path | None):
+    try:
+        click.echo(generate(int(day), scale, seed, output))
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="--scale")
+
+
+@main.command()
+@click.option("-d", "--day", "days", type=click.Choice([str(day) for day in BENCHMARK_SCALES]), multiple=True)
+@click.option("-p", "--part", "parts", type=click.IntRange(1, 2), multiple=True, default=(1, 2))
+@click.option("-r", "--repetitions", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option("--warmup", type=click.IntRange(min=0), default=1, show_default=True)
+@click.option("--quick", is_flag=True, help="Only run the smallest scale of every day")
+@click.option("--baseline", type=click.Path(dir_okay=False, path_type=Path), default=BASELINE_PATH, show_default=True)
+@click.option("--save", is_flag=True, help="Write the results as the new baseline instead of comparing against it")
+@click.option("-t", "--threshold", type=float, default=0.1, show_default=True, help="Allowed median slowdown")
+def bench(
+    days: tuple[str, ...],
+    parts: tuple[int, ...],
+    repetitions: int,
+    warmup: int,
+    quick: bool,
+    baseline: Path,
+    save: bool,
+    threshold: float,
+):
+    results = []
+    for case in benchmark_cases([int(day) for day in days] or BENCHMARK_SCALES, parts, quick):
+        results.append(result := run_benchmark(case, repetitions, warmup))
+        click.echo(result)
+
+    if save:
+        save_baseline(results, baseline)
+        click.echo(f"Saved baseline to {baseline}")
+    elif baseline.is_file():
+        if regressions := find_regressions(results, load_baseline(baseline), threshold):
+            for regression in regressions:
+                click.echo(f"REGRESSION {regression}", err=True)
+            raise click.ClickException(f"{len(regressions)} cases regressed by more than {threshold:.0%}")
+        click.echo(f"No regressions against {baseline}")
+
+
+@main.command(name="serve")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), default=SOCKET_PATH, show_default=True)
+@click.option("--max-inputs", type=click.IntRange(min=1), default=MAX_PARSED_INPUTS, show_default=True)
+def serve_daemon(socket_path: Path, max_inputs: int):
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    click.echo(f"Listening on {socket_path}", err=True)
+    try:
+        serve(socket_path, max_inputs)
+    except RuntimeError as error:
+        raise click.ClickException(str(error))
+    except KeyboardInterrupt:
+        pass
+
+
+@main.command()
+@click.option("-d", "--day", type=int, required=True)
+@click.option("-p", "--part", "parts", type=click.IntRange(1, 2), multiple=True, default=(1, 2))
+@click.option("-i", "--input", "input_name", default="full", help="Input file, or suffix of 2023/input_<day>_<suffix>")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), default=SOCKET_PATH, show_default=True)
+def ask(day: int, parts: tuple[int, ...], input_name: str, socket_path: Path):
+    for part in parts:
+        try:
+            response = request(day, part, input_name, socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise click.ClickException(f"No daemon is listening on {socket_path}, start one with `aoc.py serve`")
+        except ConnectionError as error:
+            raise click.ClickException(str(error))
+        if "error" in response:
+            raise click.ClickException(response["error"])
+        click.echo(format_response(response))
+
+
+@main.command()
+@click.option("-d", "--day", "days", type=int, multiple=True, help="Days to measure  [default: all]")
+@click.option(
+    "-i", "--input", "input_name", default="test", show_default=True, help="Suffix of 2023/input_<day>_<suffix>"
+)
+@click.option("-r", "--repetitions", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option(
+    "--budget-ms",
+    type=float,
+    default=STARTUP_BUDGET_MS,
+    show_default=True,
+    help="Fail when importing a day takes longer than this",
+)
+def startup(days: tuple[int, ...], input_name: str, repetitions: int, budget_ms: float):
+    interpreter_ms = measure_interpreter_start(repetitions)
+    over_budget = []
+    for day in days or available_days():
+        if not (input_path := resolve_input(day, input_name)).is_file():
+            click.echo(f"Skipping day {day}: {input_path} does not exist", err=True)
+            continue
+        report = measure_startup(day, input_path, repetitions, interpreter_ms)
+        click.echo(report)
+        if report.imports_click or report.import_ms > budget_ms:
+            over_budget.append(report)
+
+    for report in over_budget:
+        click.echo(f"OVER BUDGET {report}", err=True)
+    if over_budget:
+        raise click.ClickException(f"{len(over_budget)} days import click or take longer than {budget_ms} ms to import")
+
+
+@main.command(name="diff-test")
+@click.option("-d", "--day", "days", type=int, multiple=True, help="Days to compare  [default: all with a reference]")
+@click.option("-p", "--part", "parts", type=click.IntRange(1, 2), multiple=True, default=(1, 2))
+@click.option("-n", "--seeds", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option("--report", type=click.Path(dir_okay=False, path_type=Path), default=REPORT_PATH, show_default=True)
+def diff_test(days: tuple[int, ...], parts: tuple[int, ...], seeds: int, report: Path):
+    if unknown_days := set(days) - set(reference_days()):
+        raise click.BadParameter(f"No reference solution for days {sorted(unknown_days)}", param_hint="--day")
+    results = []
+    mismatches = 0
+    for case in diff_cases(days or reference_days(), parts, seeds):
+        results.append(result := run_case(case))
+        click.echo(result)
+        if not result.matches:
+            mismatches += 1
+            smallest = minimise(result)
+            reproducer = write_reproducer(smallest)
+            click.echo(f"  minimised to {smallest}", err=True)
+            click.echo(f"  reproduce with: python aoc.py run -d {case.day} -p {case.part} -i {reproducer}", err=True)
+
+    save_report(results, report)
+    click.echo(f"Wrote {report}")
+    if mismatches:
+        raise click.ClickException(f"{mismatches} of {len(results)} cases differ from the reference")
+
+
+@main.command()
+@click.option("--results", is_flag=True, help="Also clear the memoized results")
+def clear_cache(results: bool):
+    ParseCache().clear()
+    if results:
+        ResultStore().clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+from parse_cache import file_digest
+from registry import load_solution
+from runner import PartResult, run_parts
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    input_path: Path
+    digest: str
+    results: list[PartResult]
+    error: str | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        line: dict[str, Any] = {"input": str(self.input_path), "digest": self.digest}
+        if self.error is not None:
+            line["error"] = self.error
+            return line
+        line["parts"] = {
+            str(result.part): {
+                "answer": result.answer,
+                "parse_ms": None if result.parse is None or result.parse_shared else result.parse.wall_ms,
+                "solve_ms": result.solve.wall_ms,
+            }
+            for result in self.results
+        }
+        return line
+
+
+def find_inputs(patterns: Iterable[str]) -> list[Path]:
+    input_paths: dict[Path, None] = {}
+    for pattern in patterns:
+        if (directory := Path(pattern)).is_dir():
+            matches = sorted(path for path in directory.iterdir() if path.is_file() and not path.name.startswith("."))
+        else:
+            matches = sorted(Path(match) for match in glob.glob(pattern, recursive=True) if Path(match).is_file())
+        input_paths.update(dict.fromkeys(matches))
+    return list(input_paths)
+
+
+def solve_input(day: int, parts: Sequence[int], input_path: Path) -> BatchResult:
+    # The worker hashes the file right before solving it, so the solver's own read hits the page cache.
+    digest = file_digest(input_path)
+    try:
+        return BatchResult(input_path, digest, run_parts(day, parts, input_path))
+    except Exception as exception:
+        return BatchResult(input_path, digest, [], f"{type(exception).__name__}: {exception}")
+
+
+def run_batch(
+    day: int, parts: Sequence[int], input_paths: Sequence[Path], workers: int | None = None
+) -> Iterator[BatchResult]:
+    # Every input goes straight to the pool, so results stream out as soon as the first inputs are solved.
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_solution, initargs=(day,)) as solver_pool:
+        futures = {solver_pool.submit(solve_input, day, parts, input_path): input_path for input_path in input_paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as exception:
+                yield BatchResult(futures[future], "", [], f"{type(exception).__name__}: {exception}")
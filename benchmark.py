@@ -0,0 +1,134 @@
+import gc
+import json
+import math
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from generators import generate
+from registry import get_part_function, load_solution
+
+BASELINE_PATH = Path(__file__).resolve().parent / ".cache" / "benchmark_baseline.json"
+BENCHMARK_SCALES = {
+    1: (1_000, 10_000, 100_000),
+    2: (1_000, 10_000, 100_000),
+    3: (50, 200, 500),
+    4: (1_000, 10_000, 100_000),
+    5: (10, 50, 200),
+    6: (2, 4, 6),
+    7: (1_000, 10_000, 50_000),
+    8: (100, 1_000, 10_000),
+    9: (1_000, 10_000, 50_000),
+    10: (10, 20, 40),
+    11: (50, 100, 200),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    day: int
+    part: int
+    scale: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}:{self.part}:{self.scale}"
+
+    def __str__(self) -> str:
+        return f"Day {self.day} part {self.part} scale {self.scale}"
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    case: BenchmarkCase
+    samples_ms: list[float]
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.samples_ms)
+
+    @property
+    def p95_ms(self) -> float:
+        return percentile(self.samples_ms, 95)
+
+    def __str__(self) -> str:
+        return f"{self.case}: median {self.median_ms:.2f} ms, p95 {self.p95_ms:.2f} ms ({len(self.samples_ms)} runs)"
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    case_key: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def change(self) -> float:
+        return self.current_ms / self.baseline_ms - 1
+
+    def __str__(self) -> str:
+        return f"{self.case_key}: median {self.baseline_ms:.2f} ms -> {self.current_ms:.2f} ms ({self.change:+.1%})"
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def benchmark_cases(days: Iterable[int], parts: Iterable[int], quick: bool = False) -> Iterator[BenchmarkCase]:
+    for day in days:
+        for scale in BENCHMARK_SCALES[day][:1] if quick else BENCHMARK_SCALES[day]:
+            for part in parts:
+                yield BenchmarkCase(day, part, scale)
+
+
+def measure(function: Callable[[str], int], filename: str, repetitions: int, warmup: int) -> list[float]:
+    for _ in range(warmup):
+        function(filename)
+    samples = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            function(filename)
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def run_benchmark(case: BenchmarkCase, repetitions: int, warmup: int, seed: int = 0) -> BenchmarkResult:
+    input_path = generate(case.day, case.scale, seed)
+    function = get_part_function(load_solution(case.day), case.part)
+    return BenchmarkResult(case, measure(function, str(input_path), repetitions, warmup))
+
+
+def save_baseline(results: list[BenchmarkResult], path: Path = BASELINE_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        result.case.key: {"median_ms": result.median_ms, "p95_ms": result.p95_ms, "samples_ms": result.samples_ms}
+        for result in results
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2)
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, dict[str, float]]:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def find_regressions(
+    results: list[BenchmarkResult], baseline: dict[str, dict[str, float]], threshold: float
+) -> list[Regression]:
+    regressions = []
+    for result in results:
+        if (baseline_case := baseline.get(result.case.key)) is None:
+            continue
+        if result.median_ms > baseline_case["median_ms"] * (1 + threshold):
+            regressions.append(Regression(result.case.key, baseline_case["median_ms"], result.median_ms))
+    return regressions
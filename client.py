@@ -0,0 +1,60 @@
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+# Only socket and json are imported here: asking a warm daemon should cost an interpreter start and not much more,
+# so this module stays free of click and of the solver machinery that aoc.py pulls in.
+SOCKET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "aoc.sock")
+PARTS = (1, 2)
+USAGE = f"usage: python {os.path.basename(__file__)} DAY [INPUT] [PART]"
+
+
+def request(day: int, part: int, input_name: str, socket_path: str | os.PathLike = SOCKET_PATH) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(os.fspath(socket_path))
+        if os.path.isfile(input_name):
+            input_name = os.path.abspath(input_name)
+        client.sendall(json.dumps({"day": day, "part": part, "input": input_name}).encode() + b"\n")
+        with client.makefile("rb") as response:
+            if not (line := response.readline()):
+                raise ConnectionError("Daemon closed the connection without answering")
+            return json.loads(line)
+
+
+def format_response(response: dict[str, Any]) -> str:
+    if response["warm"]:
+        parse = "warm"
+    else:
+        parse = "n/a" if response["parse_ms"] is None else f"{response['parse_ms']:.2f} ms"
+    return (
+        f"Day {response['day']} part {response['part']} ({os.path.basename(response['input'])}): {response['answer']}"
+        f"  parse {parse}  solve {response['solve_ms']:.2f} ms"
+    )
+
+
+def main(argv: list[str]) -> int:
+    if not 1 <= len(argv) <= 3 or not all(arg.isdigit() for arg in argv[:1] + argv[2:]):
+        print(USAGE, file=sys.stderr)
+        return 2
+    day = int(argv[0])
+    input_name = argv[1] if len(argv) >= 2 else "full"
+    for part in (int(argv[2]),) if len(argv) == 3 else PARTS:
+        try:
+            response = request(day, part, input_name)
+        except (FileNotFoundError, ConnectionRefusedError):
+            print(f"No daemon is listening on {SOCKET_PATH}, start one with `aoc.py serve`", file=sys.stderr)
+            return 1
+        except ConnectionError as error:
+            print(error, file=sys.stderr)
+            return 1
+        if "error" in response:
+            print(response["error"], file=sys.stderr)
+            return 1
+        print(format_response(response))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
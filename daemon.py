@@ -0,0 +1,138 @@
+import json
+import socket
+import socketserver
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from client import SOCKET_PATH as CLIENT_SOCKET_PATH
+from registry import (
+    available_days,
+    get_parse_and_solve_functions,
+    get_part_function,
+    load_solution,
+)
+from runner import Timing, resolve_input, timed
+
+SOCKET_PATH = Path(CLIENT_SOCKET_PATH)
+MAX_PARSED_INPUTS = 32
+
+ParsedKey = tuple[int, str, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class DaemonResult:
+    day: int
+    part: int
+    input_path: str
+    answer: int
+    parse: Timing | None
+    solve: Timing
+    warm: bool
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "day": self.day,
+            "part": self.part,
+            "input": self.input_path,
+            "answer": self.answer,
+            "parse_ms": None if self.parse is None else self.parse.wall_ms,
+            "solve_ms": self.solve.wall_ms,
+            "warm": self.warm,
+        }
+
+
+class WarmSolver:
+    max_parsed_inputs: int
+    parsed_inputs: OrderedDict[ParsedKey, Any]
+
+    def __init__(self, max_parsed_inputs: int = MAX_PARSED_INPUTS):
+        self.max_parsed_inputs = max_parsed_inputs
+        self.parsed_inputs = OrderedDict()
+
+    def preload(self):
+        for day in available_days():
+            load_solution(day)
+
+    def solve(self, day: int, part: int, input_path: Path) -> DaemonResult:
+        module = load_solution(day)
+        if (functions := get_parse_and_solve_functions(module, part)) is None:
+            answer, solve_timing = timed(get_part_function(module, part), str(input_path))
+            return DaemonResult(day, part, str(input_path), answer, None, solve_timing, warm=False)
+
+        parse, solve = functions
+        stat = input_path.stat()
+        key = (day, str(input_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        warm = key in self.parsed_inputs
+        if warm:
+            self.parsed_inputs.move_to_end(key)
+            parsed, parse_timing = self.parsed_inputs[key], Timing(0, 0)
+        else:
+            parsed, parse_timing = timed(parse, str(input_path))
+            self.parsed_inputs[key] = parsed
+            while len(self.parsed_inputs) > self.max_parsed_inputs:
+                self.parsed_inputs.popitem(last=False)
+        answer, solve_timing = timed(solve, parsed)
+        return DaemonResult(day, part, str(input_path), answer, parse_timing, solve_timing, warm)
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        try:
+            day, part = int(request["day"]), int(request["part"])
+            if day not in available_days():
+                raise ValueError(f"No solution for day {day}")
+            if part not in (1, 2):
+                raise ValueError(f"No part {part}")
+            if not (input_path := resolve_input(day, str(request.get("input", "full")))).is_file():
+                raise ValueError(f"{input_path} does not exist")
+            return self.solve(day, part, input_path).to_json()
+        except Exception as error:
+            # A failing solver must not take the connection down with it; the client reports the error instead.
+            return {"error": f"{type(error).__name__}: {error}"}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: "SolverServer"
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as error:
+                response = {"error": f"Invalid request: {error}"}
+            else:
+                response = self.server.solver.handle(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    solver: WarmSolver
+
+    def __init__(self, socket_path: Path, solver: WarmSolver):
+        self.solver = solver
+        super().__init__(str(socket_path), RequestHandler)
+
+
+def serve(socket_path: Path = SOCKET_PATH, max_parsed_inputs: int = MAX_PARSED_INPUTS):
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        if is_serving(socket_path):
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        socket_path.unlink()
+    solver = WarmSolver(max_parsed_inputs)
+    solver.preload()
+    try:
+        with SolverServer(socket_path, solver) as server:
+            server.serve_forever()
+    finally:
+        socket_path.unlink(missing_ok=True)
+
+
+def is_serving(socket_path: Path = SOCKET_PATH) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
@@ -0,0 +1,124 @@
+import json
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from generators import generate
+from registry import get_part_function, load_reference, load_solution
+from runner import Timing, timed
+
+REPRODUCERS_DIR = Path(__file__).resolve().parent / ".cache" / "diff"
+REPORT_PATH = REPRODUCERS_DIR / "report.json"
+DIFF_TEST_SCALES = {
+    5: (2, 5, 10, 20),
+    7: (10, 100, 1_000),
+    10: (5, 8, 13, 21),
+    11: (10, 30, 60),
+}
+MAX_SHRINK_STEPS = 50
+
+
+@dataclass(frozen=True, slots=True)
+class DiffCase:
+    day: int
+    part: int
+    scale: int
+    seed: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}:{self.part}:{self.scale}:{self.seed}"
+
+    def __str__(self) -> str:
+        return f"Day {self.day} part {self.part} scale {self.scale} seed {self.seed}"
+
+
+@dataclass(frozen=True, slots=True)
+class DiffResult:
+    case: DiffCase
+    input_path: Path
+    reference_answer: Any
+    answer: Any
+    reference: Timing
+    fast: Timing
+
+    @property
+    def matches(self) -> bool:
+        return self.reference_answer == self.answer
+
+    @property
+    def speedup(self) -> float:
+        return self.reference.wall_ms / self.fast.wall_ms if self.fast.wall_ms else float("inf")
+
+    def __str__(self) -> str:
+        outcome = "ok" if self.matches else f"MISMATCH reference {self.reference_answer!r} != {self.answer!r}"
+        return (
+            f"{self.case}: {outcome}  reference {self.reference.wall_ms:.2f} ms"
+            f"  fast {self.fast.wall_ms:.2f} ms ({self.speedup:.2f}x)"
+        )
+
+
+def diff_cases(days: Iterable[int], parts: Iterable[int], seeds: int) -> Iterator[DiffCase]:
+    for day in days:
+        for scale in DIFF_TEST_SCALES[day]:
+            for seed in range(seeds):
+                for part in parts:
+                    yield DiffCase(day, part, scale, seed)
+
+
+def run_guarded(function: Callable[[str], Any], filename: str) -> tuple[Any, Timing]:
+    try:
+        return timed(function, filename)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}", Timing(0, 0)
+
+
+def run_case(case: DiffCase) -> DiffResult:
+    input_path = generate(case.day, case.scale, case.seed)
+    reference_answer, reference_timing = run_guarded(
+        get_part_function(load_reference(case.day), case.part), str(input_path)
+    )
+    answer, fast_timing = run_guarded(get_part_function(load_solution(case.day), case.part), str(input_path))
+    return DiffResult(case, input_path, reference_answer, answer, reference_timing, fast_timing)
+
+
+def minimise(result: DiffResult) -> DiffResult:
+    # Halve the scale while the mismatch persists, then step it down one at a time, always keeping the seed.
+    smallest = result
+    for halve in (True, False):
+        for _ in range(MAX_SHRINK_STEPS):
+            case = smallest.case
+            if (scale := case.scale // 2 if halve else case.scale - 1) < 1:
+                break
+            try:
+                candidate = run_case(DiffCase(case.day, case.part, scale, case.seed))
+            except ValueError:
+                break
+            if candidate.matches:
+                break
+            smallest = candidate
+    return smallest
+
+
+def write_reproducer(result: DiffResult, directory: Path = REPRODUCERS_DIR) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    case = result.case
+    path = directory / f"input_{case.day}_part_{case.part}_scale_{case.scale}_seed_{case.seed}"
+    shutil.copyfile(result.input_path, path)
+    return path
+
+
+def save_report(results: list[DiffResult], path: Path = REPORT_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        result.case.key: {
+            "matches": result.matches,
+            "reference_ms": result.reference.wall_ms,
+            "fast_ms": result.fast.wall_ms,
+            "speedup": result.speedup,
+        }
+        for result in results
+    }
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
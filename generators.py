@@ -0,0 +1,227 @@
+import itertools
+import string
+from pathlib import Path
+from random import Random
+from typing import Callable, TextIO
+
+INPUTS_DIR = Path(__file__).resolve().parent / ".cache" / "inputs"
+DIGIT_WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+COLOURS = ("red", "green", "blue")
+SYMBOLS = "*#+$/@=%&-"
+ITEM_TYPES = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+CARDS = "AKQJT98765432"
+PIPES_BY_DIRECTIONS = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+MAX_RACES = 6
+MAX_NODES = 26**3
+
+Generator = Callable[[TextIO, int, Random], None]
+
+
+def generate_day_1(file: TextIO, scale: int, rng: Random):
+    tokens = list(string.ascii_lowercase) + list(string.digits[1:]) + list(DIGIT_WORDS)
+    for _ in range(scale):
+        line = rng.choices(tokens, k=rng.randint(3, 20))
+        line.insert(rng.randint(0, len(line)), str(rng.randint(1, 9)))
+        file.write("".join(line) + "\n")
+
+
+def generate_day_2(file: TextIO, scale: int, rng: Random):
+    for game_id in range(1, scale + 1):
+        draws: list[dict[str, int]] = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(COLOURS, rng.randint(1, len(COLOURS)))
+            draws.append({colour: rng.randint(1, 20) for colour in colours})
+        for colour in COLOURS:
+            if not any(colour in draw for draw in draws):
+                rng.choice(draws)[colour] = rng.randint(1, 20)
+        raw_draws = "; ".join(", ".join(f"{count} {colour}" for colour, count in draw.items()) for draw in draws)
+        file.write(f"Game {game_id}: {raw_draws}\n")
+
+
+def generate_day_3(file: TextIO, scale: int, rng: Random):
+    for _ in range(scale):
+        row: list[str] = []
+        while len(row) < scale:
+            roll = rng.random()
+            if roll < 0.08:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif roll < 0.12:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        file.write("".join(row[:scale]) + "\n")
+
+
+def generate_day_4(file: TextIO, scale: int, rng: Random):
+    width = len(str(scale))
+    for card_id in range(1, scale + 1):
+        winning_numbers = " ".join(f"{number:>2}" for number in rng.sample(range(1, 100), 10))
+        my_numbers = " ".join(f"{number:>2}" for number in rng.sample(range(1, 100), 25))
+        file.write(f"Card {card_id:>{width}}: {winning_numbers} | {my_numbers}\n")
+
+
+def generate_day_5(file: TextIO, scale: int, rng: Random):
+    domain = range(2**32)
+    seed_bounds = sorted(rng.sample(domain, 20))
+    seed_numbers = itertools.chain.from_iterable(
+        (start, end - start) for start, end in itertools.batched(seed_bounds, 2)
+    )
+    file.write(f"seeds: {' '.join(str(number) for number in seed_numbers)}\n")
+    for source, destination in itertools.pairwise(ITEM_TYPES):
+        file.write(f"\n{source}-to-{destination} map:\n")
+        source_bounds = sorted(rng.sample(domain, 2 * scale))
+        source_ranges = [(start, end - start) for start, end in itertools.batched(source_bounds, 2)]
+        rng.shuffle(source_ranges)
+        for source_range_start, range_length in source_ranges:
+            destination_range_start = rng.randrange(2**32 - range_length)
+            file.write(f"{destination_range_start} {source_range_start} {range_length}\n")
+
+
+def generate_day_6(file: TextIO, scale: int, rng: Random):
+    if scale > MAX_RACES:
+        raise ValueError(f"Part two concatenates every race, so at most {MAX_RACES} races fit in a float")
+    while True:
+        times = [rng.randint(10, 99) for _ in range(scale)]
+        distances = [rng.randint(1, time**2 // 4 - 1) for time in times]
+        total_time = int("".join(str(time) for time in times))
+        total_distance = int("".join(str(distance) for distance in distances))
+        if total_time**2 > 4 * total_distance:
+            break
+    file.write("Time:    " + "".join(f"{time:>5}" for time in times) + "\n")
+    file.write("Distance:" + "".join(f"{distance:>5}" for distance in distances) + "\n")
+
+
+def generate_day_7(file: TextIO, scale: int, rng: Random):
+    for _ in range(scale):
+        file.write(f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}\n")
+
+
+def generate_day_8(file: TextIO, scale: int, rng: Random):
+    if not 4 <= scale <= MAX_NODES:
+        raise ValueError(f"Day 8 supports between 4 and {MAX_NODES} nodes")
+    number_of_ghosts = min(6, scale // 4)
+    names = ["".join(letters) for letters in itertools.product(string.ascii_uppercase, repeat=3)]
+    start_nodes = ["AAA"] + rng.sample(
+        [name for name in names if name[-1] == "A" and name != "AAA"], number_of_ghosts - 1
+    )
+    end_nodes = ["ZZZ"] + rng.sample(
+        [name for name in names if name[-1] == "Z" and name != "ZZZ"], number_of_ghosts - 1
+    )
+    middle_candidates = [name for name in names if name[-1] not in "AZ"]
+    middle_nodes = rng.sample(middle_candidates, min(scale - 2 * number_of_ghosts, len(middle_candidates)))
+
+    lines = []
+    chain_cuts = sorted(rng.sample(range(1, len(middle_nodes)), number_of_ghosts - 1))
+    for ghost, (start, end) in enumerate(itertools.pairwise([0, *chain_cuts, len(middle_nodes)])):
+        chain = middle_nodes[start:end]
+        for node, next_node in itertools.pairwise([start_nodes[ghost], *chain, end_nodes[ghost]]):
+            lines.append(f"{node} = ({next_node}, {next_node})")
+        lines.append(f"{end_nodes[ghost]} = ({chain[0]}, {chain[0]})")
+    rng.shuffle(lines)
+
+    file.write("".join(rng.choices("LR", k=rng.randint(50, 300))) + "\n\n")
+    file.write("\n".join(lines) + "\n")
+
+
+def generate_day_9(file: TextIO, scale: int, rng: Random):
+    for _ in range(scale):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        sequence = (sum(coefficient * x**power for power, coefficient in enumerate(coefficients)) for x in range(21))
+        file.write(" ".join(str(number) for number in sequence) + "\n")
+
+
+def generate_day_10(file: TextIO, scale: int, rng: Random):
+    if scale < 4:
+        raise ValueError("Day 10 needs a grid of at least 4 by 4")
+    # The loop is the boundary of a row-convex polyomino whose rows overlap by at least one cell, which
+    # rules out holes and pinch points. Grid cells correspond to the lattice vertices of that polyomino.
+    cells = scale - 3
+    intervals = [(start := rng.randrange(cells), rng.randint(start, cells - 1))]
+    for _ in range(1, cells):
+        previous_start, previous_end = intervals[-1]
+        start = min(max(previous_start + rng.randint(-3, 3), 0), previous_end)
+        end = max(min(previous_end + rng.randint(-3, 3), cells - 1), previous_start, start)
+        intervals.append((start, end))
+
+    neighbours: dict[tuple[int, int], set[str]] = {}
+
+    def add_edge(x: int, y: int, horizontal: bool):
+        neighbours.setdefault((x, y), set()).add("E" if horizontal else "S")
+        neighbours.setdefault((x + 1, y) if horizontal else (x, y + 1), set()).add("W" if horizontal else "N")
+
+    for interval_row, (start, end) in enumerate(intervals):
+        add_edge(start, interval_row, horizontal=False)
+        add_edge(end + 1, interval_row, horizontal=False)
+        for other_row, edge_row in ((interval_row - 1, interval_row), (interval_row + 1, interval_row + 1)):
+            other_start, other_end = intervals[other_row] if 0 <= other_row < cells else (cells, -1)
+            for col in range(start, end + 1):
+                if not other_start <= col <= other_end:
+                    add_edge(col, edge_row, horizontal=True)
+
+    top_left = (intervals[0][0], 0)
+    start_candidates = [vertex for vertex in neighbours if vertex not in ((top_left[0] + 1, 0), (top_left[0], 1))]
+    start_position = rng.choice(start_candidates)
+    next_to_start = {(start_position[0] + dx, start_position[1] + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))}
+    for y in range(-1, cells + 2):
+        row: list[str] = []
+        for x in range(-1, cells + 2):
+            if (x, y) == start_position:
+                row.append("S")
+            elif (x, y) in neighbours:
+                row.append(PIPES_BY_DIRECTIONS[frozenset(neighbours[(x, y)])])
+            elif (x, y) in next_to_start or rng.random() < 0.5:
+                row.append(".")
+            else:
+                row.append(rng.choice("|-LJ7F"))
+        file.write("".join(row) + "\n")
+
+
+def generate_day_11(file: TextIO, scale: int, rng: Random):
+    empty_cols = set(rng.sample(range(scale), max(1, scale // 20)))
+    allowed_cols = [col for col in range(scale) if col not in empty_cols]
+    galaxies_per_row = max(1, round(0.02 * scale))
+    for _ in range(scale):
+        row = ["."] * scale
+        if rng.random() >= 0.05:
+            for col in rng.sample(allowed_cols, min(rng.randint(1, 2 * galaxies_per_row), len(allowed_cols))):
+                row[col] = "#"
+        file.write("".join(row) + "\n")
+
+
+GENERATORS: dict[int, Generator] = {
+    1: generate_day_1,
+    2: generate_day_2,
+    3: generate_day_3,
+    4: generate_day_4,
+    5: generate_day_5,
+    6: generate_day_6,
+    7: generate_day_7,
+    8: generate_day_8,
+    9: generate_day_9,
+    10: generate_day_10,
+    11: generate_day_11,
+}
+
+
+def generated_input_path(day: int, scale: int, seed: int) -> Path:
+    return INPUTS_DIR / f"input_{day}_scale_{scale}_seed_{seed}"
+
+
+def generate(day: int, scale: int, seed: int = 0, path: Path | None = None) -> Path:
+    path = path or generated_input_path(day, scale, seed)
+    if path.is_file():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(f"{path.name}.partial")
+    with open(partial_path, "w", newline="\n") as file:
+        GENERATORS[day](file, scale, Random(f"{day}:{scale}:{seed}"))
+    partial_path.replace(path)
+    return path
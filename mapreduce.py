@@ -0,0 +1,51 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+from registry import load_solution
+
+CHUNKS_PER_WORKER = 4
+LINE_SCORERS_NAME = "LINE_SCORERS"
+
+
+def get_line_scorer(module: ModuleType, part: int) -> Callable[[str], int] | None:
+    return getattr(module, LINE_SCORERS_NAME, {}).get(part)
+
+
+def chunk_boundaries(input_path: Path, number_of_chunks: int) -> list[tuple[int, int]]:
+    size = input_path.stat().st_size
+    boundaries = [0]
+    with open(input_path, "rb") as file:
+        for chunk in range(1, number_of_chunks):
+            file.seek(max(size * chunk // number_of_chunks, boundaries[-1]))
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return [(start, end) for start, end in itertools.pairwise(boundaries) if end > start]
+
+
+def score_chunk(day: int, part: int, input_path: Path, start: int, end: int) -> int:
+    score_line = get_line_scorer(load_solution(day), part)
+    assert score_line is not None
+    total = 0
+    position = start
+    with open(input_path, "rb") as file:
+        file.seek(start)
+        for line in file:
+            total += score_line(line.decode().rstrip("\n"))
+            if (position := position + len(line)) >= end:
+                break
+    return total
+
+
+def map_reduce(day: int, part: int, input_path: Path, workers: int | None = None) -> int:
+    if get_line_scorer(load_solution(day), part) is None:
+        raise ValueError(f"Day {day} part {part} is not a sum of independent per-line values")
+    workers = workers or os.cpu_count() or 1
+    chunks = chunk_boundaries(input_path, workers * CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(score_chunk, day, part, input_path, start, end) for start, end in chunks]
+        return sum(future.result() for future in futures)
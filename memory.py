@@ -0,0 +1,68 @@
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from registry import get_parse_and_solve_functions, get_part_function, load_solution
+
+IGNORED_TRACES = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseMemory:
+    name: str
+    peak_bytes: int
+    retained_bytes: int
+    top_allocations: list[tracemalloc.StatisticDiff]
+
+    def __str__(self) -> str:
+        lines = [f"{self.name}: peak {format_bytes(self.peak_bytes)}, retained {format_bytes(self.retained_bytes)}"]
+        lines.extend(f"    {statistic}" for statistic in self.top_allocations)
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryReport:
+    day: int
+    part: int
+    input_path: Path
+    answer: int
+    phases: list[PhaseMemory]
+
+    def __str__(self) -> str:
+        header = f"Day {self.day} part {self.part} ({self.input_path.name}): {self.answer}"
+        return "\n".join([header, *(f"  {phase}" for phase in self.phases)])
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024  # type: ignore[assignment]
+    return f"{size:.1f} GiB"
+
+
+def measure_phase(name: str, top: int, function: Callable[..., Any], *args: Any) -> tuple[Any, PhaseMemory]:
+    before = tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES)
+    tracemalloc.reset_peak()
+    start_bytes, _ = tracemalloc.get_traced_memory()
+    result = function(*args)
+    end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES)
+    top_allocations = [statistic for statistic in after.compare_to(before, "lineno") if statistic.size_diff > 0][:top]
+    return result, PhaseMemory(name, peak_bytes - start_bytes, end_bytes - start_bytes, top_allocations)
+
+
+def measure_part(day: int, part: int, input_path: Path, top: int = 5) -> MemoryReport:
+    module = load_solution(day)
+    tracemalloc.start()
+    try:
+        if (functions := get_parse_and_solve_functions(module, part)) is None:
+            answer, phase = measure_phase("parse and solve", top, get_part_function(module, part), str(input_path))
+            return MemoryReport(day, part, input_path, answer, [phase])
+        parse, solve = functions
+        parsed, parse_phase = measure_phase("parse", top, parse, str(input_path))
+        answer, solve_phase = measure_phase("solve", top, solve, parsed)
+        return MemoryReport(day, part, input_path, answer, [parse_phase, solve_phase])
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,86 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "parsed"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+TEMPORARY_SUFFIX = ".pickle.tmp"
+ORPHAN_AGE_SECONDS = 60
+
+
+def file_digest(path: str | os.PathLike) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class ParseCache:
+    directory: Path
+    max_bytes: int
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get_or_parse(
+        self, parse: Callable[[str], Any], input_path: Path, source_digest: str, input_digest: str
+    ) -> tuple[Any, bool]:
+        cache_path = self.directory / f"{self.key(source_digest, input_digest)}.pickle"
+        try:
+            with open(cache_path, "rb") as file:
+                parsed = pickle.load(file)
+            os.utime(cache_path)
+            return parsed, True
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError):
+            pass
+
+        parsed = parse(str(input_path))
+        self.store(cache_path, parsed)
+        return parsed, False
+
+    @staticmethod
+    def key(source_digest: str, input_digest: str) -> str:
+        return hashlib.sha256(f"{source_digest}:{input_digest}".encode()).hexdigest()
+
+    def store(self, cache_path: Path, parsed: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=self.directory, suffix=TEMPORARY_SUFFIX, delete=False) as file:
+            pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, cache_path)
+        self.evict()
+
+    def stat_entries(self) -> Iterator[tuple[os.stat_result, Path]]:
+        # Other processes store and evict concurrently, so entries can vanish between the glob and the stat.
+        for entry in self.directory.glob("*.pickle"):
+            try:
+                yield entry.stat(), entry
+            except FileNotFoundError:
+                continue
+
+    def evict(self):
+        entries = sorted(self.stat_entries(), key=lambda stat_and_entry: stat_and_entry[0].st_mtime)
+        total_size = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in entries:
+            if total_size <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= stat.st_size
+        self.remove_orphans()
+
+    def remove_orphans(self):
+        # Temporary files left by a writer that died before os.replace; anything older than a minute is not in use.
+        cutoff = time.time() - ORPHAN_AGE_SECONDS
+        for entry in self.directory.glob(f"*{TEMPORARY_SUFFIX}"):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+    def clear(self):
+        for pattern in ("*.pickle", f"*{TEMPORARY_SUFFIX}"):
+            for entry in self.directory.glob(pattern):
+                entry.unlink(missing_ok=True)
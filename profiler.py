@@ -0,0 +1,73 @@
+import cProfile
+import io
+import pstats
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+from registry import get_part_function, load_solution
+
+PROFILES_DIR = Path(__file__).resolve().parent / ".cache" / "profiles"
+MIN_STACK_MICROSECONDS = 1
+
+Function = tuple[str, int, str]
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileReport:
+    answer: int
+    stats: pstats.Stats
+    stats_path: Path
+    collapsed_path: Path
+
+    def top_functions(self, limit: int) -> str:
+        stream = io.StringIO()
+        self.stats.stream = stream  # type: ignore[attr-defined]
+        self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return stream.getvalue()
+
+
+def profile_part(day: int, part: int, input_path: Path, output_dir: Path = PROFILES_DIR) -> ProfileReport:
+    function = get_part_function(load_solution(day), part)
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(function, str(input_path))
+    stats = pstats.Stats(profiler)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stats_path = output_dir / f"day_{day}_part_{part}_{input_path.name}.pstats"
+    collapsed_path = stats_path.with_suffix(".collapsed")
+    stats.dump_stats(stats_path)
+    with open(collapsed_path, "w") as file:
+        write_collapsed_stacks(stats, file)
+    return ProfileReport(answer, stats, stats_path, collapsed_path)
+
+
+def function_label(function: Function) -> str:
+    filename, line_number, name = function
+    if filename == "~":
+        return name
+    return f"{name} ({Path(filename).name}:{line_number})"
+
+
+def write_collapsed_stacks(stats: pstats.Stats, file: TextIO):
+    # cProfile only records caller/callee pairs, so stacks are rebuilt from that graph and every edge's time is
+    # split between its callees in proportion to what each edge contributed to the callee's total.
+    raw_stats = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Function, dict[Function, tuple]] = {}
+    for function, (_, _, _, _, callers) in raw_stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[function] = edge
+
+    def walk(function: Function, stack: tuple[str, ...], seconds: float, visiting: set[Function]):
+        _, _, total_time, cumulative_time, _ = raw_stats[function]
+        share = seconds / cumulative_time if cumulative_time else 0
+        stack = (*stack, function_label(function))
+        if (self_microseconds := round(total_time * share * 1_000_000)) >= MIN_STACK_MICROSECONDS:
+            file.write(f"{';'.join(stack)} {self_microseconds}\n")
+        for callee, (_, _, _, edge_cumulative_time) in callees.get(function, {}).items():
+            if callee not in visiting and edge_cumulative_time * share * 1_000_000 >= MIN_STACK_MICROSECONDS:
+                walk(callee, stack, edge_cumulative_time * share, visiting | {callee})
+
+    for function, (_, _, _, cumulative_time, callers) in raw_stats.items():
+        if not callers:
+            walk(function, (), cumulative_time, {function})
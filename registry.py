@@ -0,0 +1,109 @@
+import importlib
+import os
+import sys
+from types import ModuleType
+from typing import Any, Callable
+
+# Paths are plain strings here rather than pathlib.Path: pathlib drags in a dozen modules, and running a single day
+# should cost little more than importing that day.
+YEAR = 2023
+SOLUTIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), str(YEAR))
+REFERENCE_PACKAGE = "reference"
+PART_FUNCTION_NAMES = {1: ("do_part_one", "do_part_1"), 2: ("do_part_two", "do_part_2")}
+SOLVE_FUNCTION_NAMES = {1: ("solve_part_one", "solve_part_1"), 2: ("solve_part_two", "solve_part_2")}
+PARSE_FUNCTION_NAME = "parse"
+USAGE = f"usage: python {os.path.basename(__file__)} DAY [INPUT]"
+
+
+def _days_in(directory: str) -> list[int]:
+    return sorted(
+        int(name.removeprefix("solution_").removesuffix(".py"))
+        for name in os.listdir(directory)
+        if name.startswith("solution_") and name.endswith(".py")
+    )
+
+
+def available_days() -> list[int]:
+    return _days_in(SOLUTIONS_DIR)
+
+
+def reference_days() -> list[int]:
+    return _days_in(os.path.join(SOLUTIONS_DIR, REFERENCE_PACKAGE))
+
+
+def solution_path(day: int) -> str:
+    return os.path.join(SOLUTIONS_DIR, f"solution_{day}.py")
+
+
+def input_path(day: int, name: str) -> str:
+    if os.path.isfile(name):
+        return name
+    return os.path.join(SOLUTIONS_DIR, f"input_{day}_{name}")
+
+
+def _import_from_solutions_dir(name: str) -> ModuleType:
+    if SOLUTIONS_DIR not in sys.path:
+        sys.path.insert(0, SOLUTIONS_DIR)
+    return importlib.import_module(name)
+
+
+def load_solution(day: int) -> ModuleType:
+    if not os.path.isfile(solution_path(day)):
+        raise LookupError(f"No solution for day {day}")
+    return _import_from_solutions_dir(f"solution_{day}")
+
+
+def load_reference(day: int) -> ModuleType:
+    if day not in reference_days():
+        raise LookupError(f"No reference solution for day {day}")
+    return _import_from_solutions_dir(f"{REFERENCE_PACKAGE}.solution_{day}")
+
+
+def load_counters() -> ModuleType:
+    return _import_from_solutions_dir("counters")
+
+
+def find_function(module: ModuleType, names: tuple[str, ...]) -> Callable | None:
+    for name in names:
+        if (function := getattr(module, name, None)) is not None:
+            return function
+    return None
+
+
+def get_part_function(module: ModuleType, part: int) -> Callable[[str], int]:
+    if (function := find_function(module, PART_FUNCTION_NAMES[part])) is None:
+        raise AttributeError(f"{module.__name__} has no function for part {part}")
+    return function
+
+
+def get_parse_and_solve_functions(
+    module: ModuleType, part: int
+) -> tuple[Callable[[str], Any], Callable[[Any], int]] | None:
+    parse = getattr(module, PARSE_FUNCTION_NAME, None)
+    solve = find_function(module, SOLVE_FUNCTION_NAMES[part])
+    if parse is None or solve is None:
+        return None
+    return parse, solve
+
+
+def main(argv: list[str]) -> int:
+    if not 1 <= len(argv) <= 2 or not argv[0].isdigit():
+        print(USAGE, file=sys.stderr)
+        return 2
+    day = int(argv[0])
+    filename = input_path(day, argv[1] if len(argv) == 2 else "full")
+    if not os.path.isfile(filename):
+        print(f"{filename} does not exist", file=sys.stderr)
+        return 1
+    try:
+        module = load_solution(day)
+    except LookupError as error:
+        print(error, file=sys.stderr)
+        return 1
+    for part in PART_FUNCTION_NAMES:
+        print(f"Day {day} part {part} ({os.path.basename(filename)}): {get_part_function(module, part)(filename)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
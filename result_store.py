@@ -0,0 +1,57 @@
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+STORE_PATH = Path(__file__).resolve().parent / ".cache" / "results.sqlite3"
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResult:
+    answer: int
+    wall_ms: float
+    cpu_ms: float
+    solved_at: str
+
+
+class ResultStore:
+    path: Path
+
+    def __init__(self, path: Path = STORE_PATH):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "day INTEGER, part INTEGER, input_digest TEXT, source_digest TEXT, "
+                "answer TEXT, wall_ms REAL, cpu_ms REAL, solved_at TEXT DEFAULT CURRENT_TIMESTAMP, "
+                "PRIMARY KEY (day, part, input_digest, source_digest))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, day: int, part: int, input_digest: str, source_digest: str) -> StoredResult | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT answer, wall_ms, cpu_ms, solved_at FROM results "
+                "WHERE day = ? AND part = ? AND input_digest = ? AND source_digest = ?",
+                (day, part, input_digest, source_digest),
+            ).fetchone()
+        if row is None:
+            return None
+        answer, wall_ms, cpu_ms, solved_at = row
+        return StoredResult(int(answer), wall_ms, cpu_ms, solved_at)
+
+    def put(
+        self, day: int, part: int, input_digest: str, source_digest: str, answer: int, wall_ms: float, cpu_ms: float
+    ):
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results (day, part, input_digest, source_digest, answer, wall_ms, cpu_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (day, part, input_digest, source_digest, str(answer), wall_ms, cpu_ms),
+            )
+
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
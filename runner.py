@@ -0,0 +1,222 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Sequence
+
+from parse_cache import ParseCache, file_digest
+from registry import (
+    PARSE_FUNCTION_NAME,
+    SOLUTIONS_DIR,
+    SOLVE_FUNCTION_NAMES,
+    find_function,
+    get_part_function,
+    input_path,
+    load_counters,
+    load_solution,
+)
+from result_store import ResultStore
+
+
+@dataclass(frozen=True, slots=True)
+class Timing:
+    wall_ms: float
+    cpu_ms: float
+
+    def __str__(self) -> str:
+        return f"{self.wall_ms:.2f} ms (cpu {self.cpu_ms:.2f} ms)"
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    day: int
+    part: int
+    input_path: Path
+    cache: ParseCache | None = None
+    store: ResultStore | None = None
+    count: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class PartResult:
+    day: int
+    part: int
+    input_path: str
+    answer: int
+    parse: Timing | None
+    solve: Timing
+    parse_shared: bool = False
+    parse_cached: bool = False
+    memoized: bool = False
+    counts: dict[str, int] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def total(self) -> Timing:
+        if self.memoized:
+            return Timing(0, 0)
+        if self.parse is None or self.parse_shared:
+            return self.solve
+        return Timing(self.parse.wall_ms + self.solve.wall_ms, self.parse.cpu_ms + self.solve.cpu_ms)
+
+    def __str__(self) -> str:
+        if self.error is not None:
+            return f"Day {self.day} part {self.part} ({Path(self.input_path).name}): FAILED {self.error}"
+        if self.memoized:
+            return (
+                f"Day {self.day} part {self.part} ({Path(self.input_path).name}): {self.answer}"
+                f"  memoized, originally solved in {self.solve}"
+            )
+        if self.parse_shared:
+            parse = "shared"
+        elif self.parse is None:
+            parse = "n/a"
+        else:
+            parse = f"cached in {self.parse}" if self.parse_cached else str(self.parse)
+        counts = "".join(f"  {name}={count}" for name, count in sorted(self.counts.items()))
+        return (
+            f"Day {self.day} part {self.part} ({Path(self.input_path).name}): {self.answer}"
+            f"  parse {parse}  solve {self.solve}{counts}"
+        )
+
+
+def timed(function: Callable[..., Any], *args: Any) -> tuple[Any, Timing]:
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = function(*args)
+    cpu_end = time.process_time()
+    wall_end = time.perf_counter()
+    return result, Timing((wall_end - wall_start) * 1000, (cpu_end - cpu_start) * 1000)
+
+
+def resolve_input(day: int, name: str) -> Path:
+    return Path(input_path(day, name))
+
+
+def shared_source_paths() -> list[str]:
+    return sorted(
+        os.path.join(SOLUTIONS_DIR, name)
+        for name in os.listdir(SOLUTIONS_DIR)
+        if name.endswith(".py") and not name.startswith("solution_")
+    )
+
+
+def source_digest(module: ModuleType) -> str:
+    # The day module alone is not enough: parsed objects are instances of the shared helpers (Grid, arrays from
+    # parsing), so editing one of those must invalidate cached parses and memoized answers too.
+    assert module.__file__ is not None
+    digests = [file_digest(path) for path in (module.__file__, *shared_source_paths())]
+    return hashlib.sha256(":".join(digests).encode()).hexdigest()
+
+
+def run_parts(
+    day: int,
+    parts: Sequence[int],
+    input_path: Path,
+    cache: ParseCache | None = None,
+    store: ResultStore | None = None,
+    count: bool = False,
+) -> list[PartResult]:
+    module = load_solution(day)
+    digests = (source_digest(module), file_digest(input_path)) if cache or store else ("", "")
+    module_digest, input_digest = digests
+    results: dict[int, PartResult] = {}
+    if store is not None:
+        for part in parts:
+            if (stored := store.get(day, part, input_digest, module_digest)) is not None:
+                timing = Timing(stored.wall_ms, stored.cpu_ms)
+                results[part] = PartResult(day, part, str(input_path), stored.answer, None, timing, memoized=True)
+
+    parts_to_solve = [part for part in parts if part not in results]
+    counters = load_counters()
+    if count:
+        counters.enable()
+    try:
+        solved = _solve_parts(module, day, parts_to_solve, input_path, cache, digests)
+    finally:
+        counters.disable()
+    for result in solved:
+        results[result.part] = result
+        if store is not None:
+            total = result.total
+            store.put(day, result.part, input_digest, module_digest, result.answer, total.wall_ms, total.cpu_ms)
+    return [results[part] for part in parts]
+
+
+def _solve_parts(
+    module: ModuleType,
+    day: int,
+    parts: list[int],
+    input_path: Path,
+    cache: ParseCache | None,
+    digests: tuple[str, str],
+) -> list[PartResult]:
+    if not parts:
+        return []
+    counters = load_counters()
+    counters.reset()
+    parse = getattr(module, PARSE_FUNCTION_NAME, None)
+    solves = {part: solve for part in parts if (solve := find_function(module, SOLVE_FUNCTION_NAMES[part])) is not None}
+    results: list[PartResult] = []
+    if parse is None or len(solves) < len(parts):
+        for part in parts:
+            answer, solve_timing = timed(get_part_function(module, part), str(input_path))
+            results.append(
+                PartResult(day, part, str(input_path), answer, None, solve_timing, counts=dict(counters.counts))
+            )
+            counters.reset()
+        return results
+
+    parse_cached = False
+    if cache is None:
+        parsed, parse_timing = timed(parse, str(input_path))
+    else:
+        (parsed, parse_cached), parse_timing = timed(cache.get_or_parse, parse, input_path, *digests)
+    for part, solve in solves.items():
+        answer, solve_timing = timed(solve, parsed)
+        results.append(
+            PartResult(
+                day,
+                part,
+                str(input_path),
+                answer,
+                parse_timing,
+                solve_timing,
+                parse_shared=bool(results),
+                parse_cached=parse_cached,
+                counts=dict(counters.counts),
+            )
+        )
+        counters.reset()
+    return results
+
+
+def run_part(
+    day: int,
+    part: int,
+    input_path: Path,
+    cache: ParseCache | None = None,
+    store: ResultStore | None = None,
+    count: bool = False,
+) -> PartResult:
+    return run_parts(day, (part,), input_path, cache, store, count)[0]
+
+
+def run_job(job: Job) -> PartResult:
+    # One failing day must not abort the others, so the error is reported as a result row like batch does.
+    try:
+        return run_part(job.day, job.part, job.input_path, job.cache, job.store, job.count)
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+        return PartResult(job.day, job.part, str(job.input_path), 0, None, Timing(0, 0), error=error)
+
+
+def run_jobs(jobs: Iterable[Job], workers: int | None = None) -> list[PartResult]:
+    jobs = list(jobs)
+    if workers == 1:
+        return [run_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(run_job, jobs))
@@ -1,11 +1,27 @@
-def do_part_one(filename: str) -> int:
+def parse(filename: str):
     with open(filename, "r") as file:
         pass
 
 
+def solve_part_one(parsed) -> int:
+    pass
+
+
+def solve_part_two(parsed) -> int:
+    pass
+
+
+def solve_both(filename: str) -> tuple[int, int]:
+    parsed = parse(filename)
+    return solve_part_one(parsed), solve_part_two(parsed)
+
+
+def do_part_one(filename: str) -> int:
+    return solve_part_one(parse(filename))
+
+
 def do_part_two(filename: str) -> int:
-    with open(filename, "r") as file:
-        pass
+    return solve_part_two(parse(filename))
 
 
 def main():
@@ -0,0 +1,94 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+STARTUP_BUDGET_MS = 100.0
+PROBE = """
+import sys
+import time
+
+start = time.perf_counter()
+import registry
+
+module = registry.load_solution(int(sys.argv[1]))
+imported = time.perf_counter()
+function = registry.get_part_function(module, 1)
+function(sys.argv[2])
+first_call = time.perf_counter()
+function(sys.argv[2])
+second_call = time.perf_counter()
+
+import json
+
+print(
+    json.dumps(
+        {
+            "import_ms": (imported - start) * 1000,
+            "first_call_ms": (first_call - imported) * 1000,
+            "second_call_ms": (second_call - first_call) * 1000,
+            "modules": len(sys.modules),
+            "imports_click": "click" in sys.modules,
+        }
+    )
+)
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class StartupReport:
+    day: int
+    interpreter_ms: float
+    import_ms: float
+    first_call_ms: float
+    second_call_ms: float
+    modules: int
+    imports_click: bool
+
+    @property
+    def first_call_overhead_ms(self) -> float:
+        return self.first_call_ms - self.second_call_ms
+
+    def __str__(self) -> str:
+        return (
+            f"Day {self.day}: interpreter {self.interpreter_ms:.2f} ms  import {self.import_ms:.2f} ms"
+            f"  first call {self.first_call_ms:.2f} ms (+{self.first_call_overhead_ms:.2f} ms over a warm call)"
+            f"  {self.modules} modules{'  imports click' if self.imports_click else ''}"
+        )
+
+
+def measure_interpreter_start(repetitions: int) -> float:
+    samples = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run_probe(day: int, input_path: Path) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE, str(day), str(input_path)],
+        cwd=ROOT_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def measure_startup(day: int, input_path: Path, repetitions: int, interpreter_ms: float) -> StartupReport:
+    probes = [run_probe(day, input_path) for _ in range(repetitions)]
+    return StartupReport(
+        day,
+        interpreter_ms,
+        statistics.median(probe["import_ms"] for probe in probes),
+        statistics.median(probe["first_call_ms"] for probe in probes),
+        statistics.median(probe["second_call_ms"] for probe in probes),
+        probes[0]["modules"],
+        any(probe["imports_click"] for probe in probes),
+    )